@@ -6,7 +6,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field, validator
 import re
 
-from core import BaseAgent, AgentConfig, AgentState, get_logger
+from core import BaseAgent, AgentConfig, AgentState, get_logger, register_agent
 from core.base_agent import Message, MessageType
 from core.exceptions import AgentException, ValidationException
 
@@ -38,6 +38,7 @@ class CallMetadata(BaseModel):
         return v
 
 
+@register_agent("IntakeAgent")
 class IntakeAgent(BaseAgent):
     """Agent responsible for initial call intake and validation"""
     
@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, Field, validator
 
-from core import BaseAgent, AgentConfig, get_logger
+from core import BaseAgent, AgentConfig, get_logger, register_agent
 from core.base_agent import Message, MessageType
 from core.exceptions import AgentException
 
@@ -64,6 +64,7 @@ class CallQualityAssessment(BaseModel):
     assessor: str = "AI Quality System"
 
 
+@register_agent("QualityScoringAgent")
 class QualityScoringAgent(BaseAgent):
     """Agent responsible for evaluating call quality and compliance"""
     
@@ -7,7 +7,7 @@ from enum import Enum
 from dataclasses import dataclass
 import random
 
-from core import BaseAgent, AgentConfig, get_logger
+from core import BaseAgent, AgentConfig, get_logger, register_agent
 from core.base_agent import Message, MessageType
 from core.exceptions import RoutingException
 
@@ -64,6 +64,7 @@ class RoutingRule:
     target_specialization: Optional[str] = None
 
 
+@register_agent("RoutingAgent")
 class RoutingAgent(BaseAgent):
     """Agent responsible for intelligent call routing and workload distribution"""
     
@@ -7,7 +7,7 @@ from enum import Enum
 import json
 from pydantic import BaseModel, Field
 
-from core import BaseAgent, AgentConfig, get_logger
+from core import BaseAgent, AgentConfig, get_logger, register_agent
 from core.base_agent import Message, MessageType
 from core.exceptions import AgentException
 
@@ -33,6 +33,7 @@ class CallSummary(BaseModel):
     confidence_score: float = 0.0
 
 
+@register_agent("SummarizationAgent")
 class SummarizationAgent(BaseAgent):
     """Agent responsible for generating call summaries and extracting insights"""
     
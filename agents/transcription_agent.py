@@ -7,7 +7,7 @@ from enum import Enum
 import json
 from dataclasses import dataclass
 
-from core import BaseAgent, AgentConfig, get_logger
+from core import BaseAgent, AgentConfig, get_logger, register_agent
 from core.base_agent import Message, MessageType
 from core.exceptions import TranscriptionException
 
@@ -38,6 +38,7 @@ class TranscriptionSegment:
         }
 
 
+@register_agent("TranscriptionAgent")
 class TranscriptionAgent(BaseAgent):
     """Agent responsible for converting speech to text with speaker diarization"""
     
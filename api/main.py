@@ -24,7 +24,8 @@ from communication import MessageBus, MessageBrokerType
 setup_logging(
     log_level=settings.log_level,
     log_file=settings.log_file,
-    json_format=settings.is_production
+    json_format=settings.is_production,
+    record_process_info=not settings.is_production
 )
 
 logger = get_logger(__name__)
@@ -36,6 +37,16 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting API application...")
     
+    system = getattr(app.state, "system", None)
+    if system is not None:
+        # Running inside the agent system's process (main.py combined): share its
+        # database and message bus, and leave shutting them down to the system
+        app.state.message_bus = system.message_bus
+        app.state.database = get_database()
+        logger.info("API application startup complete (sharing the agent system)")
+        yield
+        return
+    
     try:
         # Initialize database
         await initialize_database(
@@ -6,8 +6,9 @@ from typing import Dict, List, Callable, Any, Optional, Set
 from datetime import datetime
 from enum import Enum
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 import aio_pika
-from aio_pika.abc import AbstractConnection, AbstractChannel, AbstractQueue
+from aio_pika.abc import AbstractConnection, AbstractChannel, AbstractExchange, AbstractQueue
 import redis.asyncio as redis
 
 from core import get_logger
@@ -51,8 +52,14 @@ class MessageBroker(ABC):
         pass
     
     @abstractmethod
-    async def subscribe(self, topic: str, handler: Callable) -> None:
-        """Subscribe to a topic"""
+    async def subscribe(
+        self,
+        topic: str,
+        handler: Callable,
+        shared: bool = False,
+        prefetch_count: Optional[int] = None
+    ) -> None:
+        """Subscribe to a topic; shared subscriptions load-balance across replicas"""
         pass
     
     @abstractmethod
@@ -64,82 +71,128 @@ class MessageBroker(ABC):
 class RabbitMQBroker(MessageBroker):
     """RabbitMQ message broker implementation"""
     
-    def __init__(self, connection_url: str):
+    EXCHANGE_NAME = "call_center.events"
+    DEFAULT_PREFETCH = 10
+    
+    def __init__(self, connection_url: str, pool_size: int = 2):
         self.connection_url = connection_url
-        self.connection: Optional[AbstractConnection] = None
+        self.pool_size = max(1, pool_size)
+        self.connections: List[AbstractConnection] = []
+        self._pool: asyncio.Queue = asyncio.Queue()
         self.channel: Optional[AbstractChannel] = None
+        self.consumer_channels: List[AbstractChannel] = []
+        self.exchange: Optional[AbstractExchange] = None
         self.queues: Dict[str, AbstractQueue] = {}
         self.logger = get_logger(__name__)
     
+    @staticmethod
+    def _routing_key(topic: str) -> str:
+        """Map a bus topic to a topic-exchange routing key (agent_x -> agent.x)"""
+        return topic.replace("_", ".", 1)
+    
     async def connect(self) -> None:
-        """Connect to RabbitMQ"""
+        """Open the connection pool and declare the shared topic exchange"""
         try:
-            self.connection = await aio_pika.connect_robust(self.connection_url)
-            self.channel = await self.connection.channel()
-            await self.channel.set_qos(prefetch_count=10)
-            self.logger.info("Connected to RabbitMQ")
+            # Handshakes are paid pool_size times at boot, not once per subscription
+            self.connections = list(await asyncio.gather(*(
+                aio_pika.connect_robust(self.connection_url)
+                for _ in range(self.pool_size)
+            )))
+            for connection in self.connections:
+                self._pool.put_nowait(connection)
+            
+            self.channel = await self.connections[0].channel()
+            self.exchange = await self.channel.declare_exchange(
+                self.EXCHANGE_NAME,
+                aio_pika.ExchangeType.TOPIC,
+                durable=True
+            )
+            self.logger.info(f"Connected to RabbitMQ ({self.pool_size} pooled connections)")
             
         except Exception as e:
             raise CommunicationException(f"Failed to connect to RabbitMQ: {e}")
     
     async def disconnect(self) -> None:
         """Disconnect from RabbitMQ"""
-        if self.connection:
-            await self.connection.close()
+        if self.connections:
+            await asyncio.gather(
+                *(connection.close() for connection in self.connections),
+                return_exceptions=True
+            )
+            self.connections = []
+            self.consumer_channels = []
+            self._pool = asyncio.Queue()
             self.logger.info("Disconnected from RabbitMQ")
     
+    @asynccontextmanager
+    async def _acquire(self):
+        """Borrow a pooled connection, returning it when done"""
+        connection = await self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put_nowait(connection)
+    
     async def publish(self, topic: str, message: Message) -> None:
-        """Publish message to RabbitMQ exchange"""
+        """Publish message to the topic exchange"""
         try:
-            if not self.channel:
+            if not self.exchange:
                 raise CommunicationException("Not connected to RabbitMQ")
             
-            # Create exchange if not exists
-            exchange = await self.channel.declare_exchange(
-                f"call_center_{topic}",
-                aio_pika.ExchangeType.FANOUT,
-                durable=True
-            )
-            
             # Serialize message
             message_body = json.dumps(message.dict()).encode()
             
             # Publish message
-            await exchange.publish(
+            await self.exchange.publish(
                 aio_pika.Message(
                     message_body,
                     content_type="application/json",
                     message_id=message.id,
                     timestamp=datetime.utcnow()
                 ),
-                routing_key=""
+                routing_key=self._routing_key(topic)
             )
             
         except Exception as e:
             raise CommunicationException(f"Failed to publish message: {e}")
     
-    async def subscribe(self, topic: str, handler: Callable) -> None:
-        """Subscribe to RabbitMQ queue"""
+    async def subscribe(
+        self,
+        topic: str,
+        handler: Callable,
+        shared: bool = False,
+        prefetch_count: Optional[int] = None
+    ) -> None:
+        """Bind a queue for the topic on the topic exchange and consume from it"""
         try:
-            if not self.channel:
+            if not self.exchange:
                 raise CommunicationException("Not connected to RabbitMQ")
             
-            # Create exchange
-            exchange = await self.channel.declare_exchange(
-                f"call_center_{topic}",
-                aio_pika.ExchangeType.FANOUT,
-                durable=True
-            )
-            
-            # Create queue
-            queue = await self.channel.declare_queue(
-                f"queue_{topic}_{id(handler)}",
-                durable=True,
-                auto_delete=True
-            )
-            
-            # Bind queue to exchange
-            await queue.bind(exchange)
+            # Channels are cheap; give each consumer its own so prefetch is per subscription
+            async with self._acquire() as connection:
+                channel = await connection.channel()
+            await channel.set_qos(prefetch_count=prefetch_count or self.DEFAULT_PREFETCH)
+            self.consumer_channels.append(channel)
+            
+            routing_key = self._routing_key(topic)
+            if shared:
+                # Named, non-exclusive queue: replicas of an agent consume from the
+                # same queue and RabbitMQ round-robins deliveries between them
+                queue = await channel.declare_queue(
+                    f"queue.{routing_key}",
+                    durable=True,
+                    exclusive=False
+                )
+                await queue.bind(self.EXCHANGE_NAME, routing_key=routing_key)
+            else:
+                # Private queue per handler, so every subscriber gets a copy
+                queue = await channel.declare_queue(
+                    f"queue.{routing_key}.{id(handler)}",
+                    exclusive=True,
+                    auto_delete=True
+                )
+                # "#" matches zero or more words, so broadcast.# also catches "broadcast"
+                await queue.bind(self.EXCHANGE_NAME, routing_key=f"{routing_key}.#")
             
             # Set up consumer
             async def message_consumer(rabbit_message):
@@ -209,8 +262,14 @@ class RedisBroker(MessageBroker):
         except Exception as e:
             raise CommunicationException(f"Failed to publish message: {e}")
     
-    async def subscribe(self, topic: str, handler: Callable) -> None:
-        """Subscribe to Redis channel"""
+    async def subscribe(
+        self,
+        topic: str,
+        handler: Callable,
+        shared: bool = False,
+        prefetch_count: Optional[int] = None
+    ) -> None:
+        """Subscribe to Redis channel (pub/sub has no shared delivery or prefetch)"""
         try:
             if not self.pubsub:
                 raise CommunicationException("Not connected to Redis")
@@ -285,7 +344,13 @@ class MemoryBroker(MessageBroker):
                 except Exception as e:
                     self.logger.error(f"Error in message handler: {e}")
     
-    async def subscribe(self, topic: str, handler: Callable) -> None:
+    async def subscribe(
+        self,
+        topic: str,
+        handler: Callable,
+        shared: bool = False,
+        prefetch_count: Optional[int] = None
+    ) -> None:
         """Subscribe to topic in memory"""
         if topic not in self.subscriptions:
             self.subscriptions[topic] = []
@@ -301,9 +366,15 @@ class MemoryBroker(MessageBroker):
 class MessageBus:
     """Central message bus for inter-agent communication"""
     
-    def __init__(self, broker_type: MessageBrokerType, connection_config: Dict[str, Any]):
+    def __init__(
+        self,
+        broker_type: MessageBrokerType,
+        connection_config: Dict[str, Any],
+        pool_size: int = 2
+    ):
         self.broker_type = broker_type
         self.connection_config = connection_config
+        self.pool_size = pool_size
         self.broker: Optional[MessageBroker] = None
         self.handlers: Dict[str, List[MessageHandler]] = {}
         self.message_history: List[Dict[str, Any]] = []
@@ -320,7 +391,7 @@ class MessageBus:
         try:
             # Create broker instance
             if self.broker_type == MessageBrokerType.RABBITMQ:
-                self.broker = RabbitMQBroker(self.connection_config.get("url"))
+                self.broker = RabbitMQBroker(self.connection_config.get("url"), self.pool_size)
             elif self.broker_type == MessageBrokerType.REDIS:
                 self.broker = RedisBroker(self.connection_config.get("url"))
             else:
@@ -374,7 +445,9 @@ class MessageBus:
         self,
         topic: str,
         handler_func: Callable,
-        message_types: Optional[List[MessageType]] = None
+        message_types: Optional[List[MessageType]] = None,
+        shared: bool = False,
+        prefetch_count: Optional[int] = None
     ) -> str:
         """Subscribe to a topic with a message handler"""
         try:
@@ -404,7 +477,9 @@ class MessageBus:
                     self.logger.error(f"Error in message handler: {e}")
             
             # Subscribe to broker
-            await self.broker.subscribe(topic, wrapped_handler)
+            await self.broker.subscribe(
+                topic, wrapped_handler, shared=shared, prefetch_count=prefetch_count
+            )
             
             # Track handler
             if topic not in self.handlers:
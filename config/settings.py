@@ -22,6 +22,7 @@ class Settings(BaseSettings):
     app_version: str = Field(default="1.0.0", env="APP_VERSION")
     environment: Environment = Field(default=Environment.DEVELOPMENT, env="ENVIRONMENT")
     debug: bool = Field(default=True, env="DEBUG")
+    testing: bool = Field(default=False, env="TESTING")
     port: int = Field(default=8000, env="PORT")
     
     # Security
@@ -1,6 +1,6 @@
 """Core module for the Call Center System"""
 
-from .base_agent import BaseAgent, AgentState, AgentConfig
+from .base_agent import BaseAgent, AgentState, AgentConfig, AGENT_REGISTRY, register_agent
 from .logging_config import setup_logging, get_logger
 from .exceptions import (
     CallCenterException,
@@ -13,6 +13,8 @@ __all__ = [
     "BaseAgent",
     "AgentState",
     "AgentConfig",
+    "AGENT_REGISTRY",
+    "register_agent",
     "setup_logging",
     "get_logger",
     "CallCenterException",
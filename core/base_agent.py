@@ -1,7 +1,7 @@
 """Base Agent Framework with State Management"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Mapping, Set, Type
 from enum import Enum
 from datetime import datetime
 import asyncio
@@ -61,7 +61,9 @@ class AgentConfig:
     timeout_seconds: int = 300
     enable_metrics: bool = True
     enable_logging: bool = True
-    custom_config: Dict[str, Any] = field(default_factory=dict)
+    concurrency: int = 1
+    prefetch_count: Optional[int] = None
+    custom_config: Mapping[str, Any] = field(default_factory=dict)
 
 
 class AgentMetrics:
@@ -117,8 +119,10 @@ class BaseAgent(ABC):
         self.logger = get_logger(f"{self.__class__.__name__}.{self.name}")
         self.metrics = AgentMetrics()
         
-        # Message handling
-        self.message_queue: asyncio.Queue = asyncio.Queue()
+        # Message handling; the queue holds at most one prefetch window, so a
+        # full queue blocks receive_message and the broker holds back its ack
+        self.prefetch_count = config.prefetch_count or max(1, config.concurrency) * 2
+        self.message_queue: asyncio.Queue = asyncio.Queue(maxsize=self.prefetch_count)
         self.message_handlers: Dict[MessageType, Callable] = {}
         self.subscriptions: List[str] = []
         
@@ -130,6 +134,10 @@ class BaseAgent(ABC):
         self._running = False
         self._tasks: List[asyncio.Task] = []
         
+        # Messages handled at once; 1 keeps strict arrival order
+        self._concurrency = asyncio.Semaphore(max(1, config.concurrency))
+        self._inflight: Set[asyncio.Task] = set()
+        
     async def initialize(self) -> None:
         """Initialize the agent"""
         try:
@@ -188,12 +196,13 @@ class BaseAgent(ABC):
         # Stop agent-specific tasks
         await self._stop()
         
-        # Cancel all tasks
-        for task in self._tasks:
+        # Cancel all tasks, including messages still being handled
+        tasks = self._tasks + list(self._inflight)
+        for task in tasks:
             task.cancel()
         
         # Wait for tasks to complete
-        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await asyncio.gather(*tasks, return_exceptions=True)
         
         self.set_state(AgentState.SHUTDOWN)
         self.logger.info(f"Agent {self.name} stopped")
@@ -206,6 +215,9 @@ class BaseAgent(ABC):
     async def _process_messages(self) -> None:
         """Main message processing loop"""
         while self._running:
+            # Wait for a free slot so one slow message doesn't block the rest;
+            # taking it first leaves waiting messages in the queue, not in this loop
+            await self._concurrency.acquire()
             try:
                 # Get message with timeout
                 message = await asyncio.wait_for(
@@ -213,18 +225,36 @@ class BaseAgent(ABC):
                     timeout=1.0
                 )
                 
-                # Process message
-                start_time = datetime.utcnow()
-                await self._handle_message(message)
-                processing_time = (datetime.utcnow() - start_time).total_seconds()
-                
-                self.metrics.record_success(processing_time)
-                
             except asyncio.TimeoutError:
+                self._concurrency.release()
                 continue
-            except Exception as e:
-                self.logger.error(f"Error processing message: {e}")
-                self.metrics.record_failure(str(e))
+            except asyncio.CancelledError:
+                self._concurrency.release()
+                raise
+            
+            task = asyncio.create_task(self._process_message(message))
+            self._inflight.add(task)
+            task.add_done_callback(self._release_slot)
+    
+    def _release_slot(self, task: asyncio.Task) -> None:
+        """Give back a message's slot once its task is done"""
+        # A done callback runs even when the task is cancelled before it starts
+        # (as stop() does), where a finally inside the coroutine would never run
+        self._inflight.discard(task)
+        self._concurrency.release()
+    
+    async def _process_message(self, message: Message) -> None:
+        """Process a single message and record metrics"""
+        try:
+            start_time = datetime.utcnow()
+            await self._handle_message(message)
+            processing_time = (datetime.utcnow() - start_time).total_seconds()
+            
+            self.metrics.record_success(processing_time)
+            
+        except Exception as e:
+            self.logger.error(f"Error processing message: {e}")
+            self.metrics.record_failure(str(e))
     
     async def _handle_message(self, message: Message) -> None:
         """Handle incoming message"""
@@ -265,6 +295,17 @@ class BaseAgent(ABC):
         """Get current agent state"""
         return self.state
     
+    def get_status(self) -> Dict[str, Any]:
+        """Get a status snapshot of the agent"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type,
+            "state": self.state.value,
+            "metrics": self.metrics.get_stats(),
+            "state_data": self.state_data
+        }
+    
     def set_state_data(self, key: str, value: Any) -> None:
         """Store state data"""
         self.state_data[key] = value
@@ -275,20 +316,11 @@ class BaseAgent(ABC):
     
     async def _handle_status_request(self, message: Message) -> None:
         """Handle status request"""
-        status = {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type,
-            "state": self.state.value,
-            "metrics": self.metrics.get_stats(),
-            "state_data": self.state_data
-        }
-        
         reply = Message(
             type=MessageType.STATUS,
             sender=self.name,
             recipient=message.sender,
-            payload=status,
+            payload=self.get_status(),
             reply_to=message.id
         )
         
@@ -313,4 +345,16 @@ class BaseAgent(ABC):
         await self.start()
     
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__} name='{self.name}' state={self.state}>"
\ No newline at end of file
+        return f"<{self.__class__.__name__} name='{self.name}' state={self.state}>"
+
+
+# Agent classes by name, filled in by @register_agent in the agent modules
+AGENT_REGISTRY: Dict[str, Type[BaseAgent]] = {}
+
+
+def register_agent(name: str) -> Callable[[Type[BaseAgent]], Type[BaseAgent]]:
+    """Class decorator that registers an agent implementation under a name"""
+    def decorator(cls: Type[BaseAgent]) -> Type[BaseAgent]:
+        AGENT_REGISTRY[name] = cls
+        return cls
+    return decorator
\ No newline at end of file
@@ -5,13 +5,28 @@ import sys
 from pathlib import Path
 from datetime import datetime
 from pythonjsonlogger import jsonlogger
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib serializer
+    orjson = None
+
+
+def _orjson_dumps(obj: Any, default=None, **kwargs) -> str:
+    """json.dumps-compatible serializer backed by orjson"""
+    return orjson.dumps(
+        obj,
+        default=default,
+        option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
-    json_format: bool = True
+    json_format: bool = True,
+    record_process_info: bool = True
 ) -> None:
     """
     Setup logging configuration for the application
@@ -20,6 +35,7 @@ def setup_logging(
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file (optional)
         json_format: Whether to use JSON format for logs
+        record_process_info: Whether log records capture thread/process ids
     """
     
     # Create logs directory if needed
@@ -31,15 +47,24 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper()))
     
+    # Neither formatter prints thread/process ids, so skip collecting them
+    logging.logThreads = record_process_info
+    logging.logProcesses = record_process_info
+    logging.logMultiprocessing = record_process_info
+    
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
     # Create formatter
     if json_format:
+        serializer_options = (
+            {"json_serializer": _orjson_dumps, "json_default": str} if orjson else {}
+        )
         formatter = jsonlogger.JsonFormatter(
             "%(timestamp)s %(level)s %(name)s %(message)s",
-            rename_fields={"levelname": "level", "asctime": "timestamp"}
+            rename_fields={"levelname": "level", "asctime": "timestamp"},
+            **serializer_options
         )
     else:
         formatter = logging.Formatter(
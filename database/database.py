@@ -5,7 +5,7 @@ from typing import AsyncGenerator, Dict, Any, Optional, List
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
-from sqlalchemy import select, update, delete, func
+from sqlalchemy import select, update, delete, func, text
 from sqlalchemy.exc import SQLAlchemyError
 import redis.asyncio as redis
 from datetime import datetime, timedelta
@@ -82,6 +82,14 @@ class Database:
         self.is_connected = False
         self.logger.info("Database connections closed")
     
+    async def warm_pool(self, connections: int) -> None:
+        """Open pooled connections up front so the first request burst doesn't pay for them"""
+        async def _checkout() -> None:
+            async with self.engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        
+        await asyncio.gather(*(_checkout() for _ in range(connections)))
+    
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session context manager"""
@@ -1,91 +1,207 @@
 """Reusable Dashboard Components"""
 
+import functools
+
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import plotly.io as pio
 import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
+# Serialize figures with orjson when it is available (faster, smaller output)
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+
+_METRIC_CARD_HTML = """
+<div style="
+    background-color: white;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    border-left: 4px solid {color};
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    margin: 0.5rem 0;
+">
+    <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+        <span style="font-size: 1.5rem; margin-right: 0.5rem;">{icon}</span>
+        <h3 style="margin: 0; color: #333; font-size: 0.9rem;">{title}</h3>
+    </div>
+    <div style="font-size: 2rem; font-weight: bold; color: #333; margin-bottom: 0.5rem;">
+        {value}
+    </div>
+    {change}
+</div>
+"""
+
+_METRIC_CHANGE_HTML = '<div style="font-size: 0.8rem; color: #666;">{change}</div>'
+
+_AGENT_CARD_HTML = """
+<div style="
+    background-color: white;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    border: 1px solid #e0e0e0;
+    margin: 0.5rem 0;
+">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <h4 style="margin: 0; color: #333;">{name}</h4>
+            <p style="margin: 0.25rem 0; color: #666; font-size: 0.8rem;">
+                {specialization}
+            </p>
+        </div>
+        <div style="
+            background-color: {status_color};
+            color: white;
+            padding: 0.25rem 0.5rem;
+            border-radius: 1rem;
+            font-size: 0.7rem;
+            font-weight: bold;
+        ">
+            {status}
+        </div>
+    </div>
+    <div style="margin-top: 0.5rem; display: flex; justify-content: space-between;">
+        <span style="font-size: 0.8rem; color: #666;">
+            Calls: {calls_today}
+        </span>
+        <span style="font-size: 0.8rem; color: #666;">
+            Quality: {quality_score}
+        </span>
+    </div>
+</div>
+"""
+
+
+# Static parts of the live "Active Calls" gauge; only the value changes per render
+_GAUGE_BASE = dict(
+    mode="gauge+number",
+    domain={'x': [0, 1], 'y': [0, 1]},
+    title={'text': "Active Calls"},
+    gauge={
+        'axis': {'range': [None, 50]},
+        'bar': {'color': "darkblue"},
+        'steps': [
+            {'range': [0, 25], 'color': "lightgray"},
+            {'range': [25, 50], 'color': "gray"}
+        ],
+        'threshold': {
+            'line': {'color': "red", 'width': 4},
+            'thickness': 0.75,
+            'value': 40
+        }
+    }
+)
+
+_GAUGE_LAYOUT = dict(height=200, margin=dict(l=0, r=0, t=30, b=0))
+
+
+@functools.lru_cache(maxsize=16)
+def _status_color(status: str) -> str:
+    """Map an agent status to its badge color"""
+    return {
+        "available": "green",
+        "busy": "orange",
+        "offline": "red"
+    }.get(status.lower() if status else "", "gray")
+
+
+@functools.lru_cache(maxsize=16)
+def _alert_icon(alert_type: str) -> str:
+    """Map an alert type to its indicator icon"""
+    return {
+        "error": "🔴",
+        "warning": "🟡",
+        "info": "🔵",
+        "success": "🟢"
+    }.get(alert_type, "⚪")
+
+
+def _downcast_numeric(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Downcast the plotted value columns to shrink the Plotly payload"""
+    # Only y columns: x/time columns (epoch ms, float timestamps) don't survive 32 bits.
+    # to_numeric keeps the original dtype whenever the values wouldn't fit
+    for col in columns:
+        if col in df.columns and df[col].dtype.kind in 'if':
+            kind = 'integer' if df[col].dtype.kind == 'i' else 'float'
+            df[col] = pd.to_numeric(df[col], downcast=kind)
+    return df
+
 
 class CallMetricsCard:
     """Component for displaying call metrics"""
     
+    @staticmethod
+    def _html(title: str, value: Any, icon: str, change: str = "", color: str = "blue") -> str:
+        """Build the HTML for a single metrics card"""
+        return _METRIC_CARD_HTML.format(
+            title=title,
+            value=value,
+            icon=icon,
+            color=color,
+            change=_METRIC_CHANGE_HTML.format(change=change) if change else ""
+        )
+    
     @staticmethod
     def render(title: str, value: Any, icon: str, change: str = "", color: str = "blue"):
         """Render a metrics card"""
         with st.container():
-            st.markdown(f"""
-            <div style="
-                background-color: white;
-                padding: 1rem;
-                border-radius: 0.5rem;
-                border-left: 4px solid {color};
-                box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-                margin: 0.5rem 0;
-            ">
-                <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
-                    <span style="font-size: 1.5rem; margin-right: 0.5rem;">{icon}</span>
-                    <h3 style="margin: 0; color: #333; font-size: 0.9rem;">{title}</h3>
-                </div>
-                <div style="font-size: 2rem; font-weight: bold; color: #333; margin-bottom: 0.5rem;">
-                    {value}
-                </div>
-                {f'<div style="font-size: 0.8rem; color: #666;">{change}</div>' if change else ''}
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(
+                CallMetricsCard._html(title, value, icon, change, color),
+                unsafe_allow_html=True
+            )
+    
+    @staticmethod
+    def render_many(cards: List[Dict[str, Any]]):
+        """Render several metrics cards with a single markdown element.
+        
+        Each entry takes the same keys as ``render`` (title, value, icon,
+        change, color).
+        """
+        if not cards:
+            return
+        
+        st.markdown(
+            "".join(CallMetricsCard._html(**card) for card in cards),
+            unsafe_allow_html=True
+        )
 
 
 class AgentStatusCard:
     """Component for displaying agent status"""
     
+    @staticmethod
+    def _html(agent_data: Dict[str, Any]) -> str:
+        """Build the HTML for a single agent status card"""
+        return _AGENT_CARD_HTML.format(
+            name=agent_data.get('name', 'Unknown'),
+            specialization=agent_data.get('specialization', 'General'),
+            status_color=_status_color(agent_data.get("status", "offline")),
+            status=agent_data.get('status', 'Offline').upper(),
+            calls_today=agent_data.get('calls_today', 0),
+            quality_score=agent_data.get('quality_score', 0)
+        )
+    
     @staticmethod
     def render(agent_data: Dict[str, Any]):
         """Render agent status card"""
-        status_color = {
-            "available": "green",
-            "busy": "orange", 
-            "offline": "red"
-        }.get(agent_data.get("status", "offline").lower(), "gray")
-        
         with st.container():
-            st.markdown(f"""
-            <div style="
-                background-color: white;
-                padding: 1rem;
-                border-radius: 0.5rem;
-                border: 1px solid #e0e0e0;
-                margin: 0.5rem 0;
-            ">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <h4 style="margin: 0; color: #333;">{agent_data.get('name', 'Unknown')}</h4>
-                        <p style="margin: 0.25rem 0; color: #666; font-size: 0.8rem;">
-                            {agent_data.get('specialization', 'General')}
-                        </p>
-                    </div>
-                    <div style="
-                        background-color: {status_color};
-                        color: white;
-                        padding: 0.25rem 0.5rem;
-                        border-radius: 1rem;
-                        font-size: 0.7rem;
-                        font-weight: bold;
-                    ">
-                        {agent_data.get('status', 'Offline').upper()}
-                    </div>
-                </div>
-                <div style="margin-top: 0.5rem; display: flex; justify-content: space-between;">
-                    <span style="font-size: 0.8rem; color: #666;">
-                        Calls: {agent_data.get('calls_today', 0)}
-                    </span>
-                    <span style="font-size: 0.8rem; color: #666;">
-                        Quality: {agent_data.get('quality_score', 0)}
-                    </span>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(AgentStatusCard._html(agent_data), unsafe_allow_html=True)
+    
+    @staticmethod
+    def render_many(agents: List[Dict[str, Any]]):
+        """Render several agent status cards with a single markdown element"""
+        if not agents:
+            return
+        
+        st.markdown(
+            "".join(AgentStatusCard._html(agent) for agent in agents),
+            unsafe_allow_html=True
+        )
 
 
 class QualityScoreChart:
@@ -98,19 +214,23 @@ class QualityScoreChart:
             st.info("No quality data available")
             return
         
-        df = pd.DataFrame(data)
+        import plotly.express as px
+        
+        df = _downcast_numeric(pd.DataFrame(data), ['score'])
+        cols = set(df.columns)
         
         # Determine chart type based on data
-        if 'date' in df.columns or 'timestamp' in df.columns:
+        if 'date' in cols or 'timestamp' in cols:
             # Time series chart
-            date_col = 'date' if 'date' in df.columns else 'timestamp'
+            date_col = 'date' if 'date' in cols else 'timestamp'
             fig = px.line(
                 df, 
                 x=date_col, 
                 y='score',
                 title=title,
                 markers=True,
-                color_discrete_sequence=['#1f77b4']
+                color_discrete_sequence=['#1f77b4'],
+                render_mode='webgl'
             )
             fig.add_hline(y=85, line_dash="dash", annotation_text="Target (85)")
             
@@ -118,7 +238,7 @@ class QualityScoreChart:
             # Bar chart
             fig = px.bar(
                 df,
-                x='category' if 'category' in df.columns else df.columns[0],
+                x='category' if 'category' in cols else df.columns[0],
                 y='score',
                 title=title,
                 color='score',
@@ -144,28 +264,37 @@ class CallVolumeChart:
             st.info("No call volume data available")
             return
         
+        import plotly.express as px
+        
         df = pd.DataFrame(data)
         
+        # Resolve axis columns once instead of per branch
+        cols = set(df.columns)
+        x_col = 'time' if 'time' in cols else df.columns[0]
+        y_col = 'volume' if 'volume' in cols else df.columns[1]
+        df = _downcast_numeric(df, [y_col])
+        
         if chart_type == "line":
             fig = px.line(
                 df,
-                x='time' if 'time' in df.columns else df.columns[0],
-                y='volume' if 'volume' in df.columns else df.columns[1],
+                x=x_col,
+                y=y_col,
                 title="Call Volume Over Time",
-                markers=True
+                markers=True,
+                render_mode='webgl'
             )
         elif chart_type == "bar":
             fig = px.bar(
                 df,
-                x='time' if 'time' in df.columns else df.columns[0],
-                y='volume' if 'volume' in df.columns else df.columns[1],
+                x=x_col,
+                y=y_col,
                 title="Call Volume"
             )
         else:
             fig = px.area(
                 df,
-                x='time' if 'time' in df.columns else df.columns[0],
-                y='volume' if 'volume' in df.columns else df.columns[1],
+                x=x_col,
+                y=y_col,
                 title="Call Volume Trend"
             )
         
@@ -212,7 +341,7 @@ class LiveMetricsPanel:
     """Component for real-time metrics display"""
     
     @staticmethod
-    def render():
+    def render(active_calls: int = 12):
         """Render live metrics panel"""
         st.markdown("### 🔴 Live Metrics")
         
@@ -221,26 +350,8 @@ class LiveMetricsPanel:
         
         with col1:
             # Active calls gauge
-            fig = go.Figure(go.Indicator(
-                mode="gauge+number",
-                value=12,
-                domain={'x': [0, 1], 'y': [0, 1]},
-                title={'text': "Active Calls"},
-                gauge={
-                    'axis': {'range': [None, 50]},
-                    'bar': {'color': "darkblue"},
-                    'steps': [
-                        {'range': [0, 25], 'color': "lightgray"},
-                        {'range': [25, 50], 'color': "gray"}
-                    ],
-                    'threshold': {
-                        'line': {'color': "red", 'width': 4},
-                        'thickness': 0.75,
-                        'value': 40
-                    }
-                }
-            ))
-            fig.update_layout(height=200, margin=dict(l=0, r=0, t=30, b=0))
+            fig = go.Figure(go.Indicator(value=active_calls, **_GAUGE_BASE))
+            fig.update_layout(**_GAUGE_LAYOUT)
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
@@ -287,12 +398,7 @@ class AlertsPanel:
         st.markdown("### 🚨 System Alerts")
         
         for alert in alerts:
-            alert_color = {
-                "error": "🔴",
-                "warning": "🟡", 
-                "info": "🔵",
-                "success": "🟢"
-            }.get(alert["type"], "⚪")
+            alert_color = _alert_icon(alert["type"])
             
             with st.container():
                 col1, col2 = st.columns([3, 1])
@@ -346,7 +452,9 @@ class TrendAnalysisChart:
             st.info("No trend data available")
             return
         
-        df = pd.DataFrame(data)
+        import plotly.express as px
+        
+        df = _downcast_numeric(pd.DataFrame(data), [y_col])
         
         # Create base chart
         fig = px.scatter(
@@ -354,14 +462,15 @@ class TrendAnalysisChart:
             x=x_col, 
             y=y_col,
             title=title,
-            trendline="ols" if show_trend_line else None
+            trendline="ols" if show_trend_line else None,
+            render_mode='webgl'
         )
         
         # Add moving average if enough data points
         if len(df) > 5:
             df['moving_avg'] = df[y_col].rolling(window=5).mean()
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=df[x_col],
                     y=df['moving_avg'],
                     name='Moving Average',
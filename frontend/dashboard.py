@@ -1,19 +1,366 @@
 """Streamlit Dashboard for Call Center System"""
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
 import json
+from streamlit_autorefresh import st_autorefresh
 
 from database import get_database
 from core import get_logger
 from .components import CallMetricsCard, AgentStatusCard, QualityScoreChart, CallVolumeChart
 
+# Series longer than the threshold are downsampled before reaching Plotly
+_LTTB_THRESHOLD = 2000
+_LTTB_POINTS = 1500
+
+
+def _lttb(x, y, n_out: int):
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+    
+    Keeps the first and last points and, for each bucket in between, the
+    point forming the largest triangle with the previously selected point
+    and the average of the next bucket. Non-numeric x values (labels) are
+    treated as evenly spaced.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out < 3 or n <= n_out:
+        return x, y
+    
+    if np.issubdtype(x.dtype, np.datetime64):
+        xs = x.astype('datetime64[ns]').astype(np.int64).astype(float)
+    elif np.issubdtype(x.dtype, np.number):
+        xs = x.astype(float)
+    else:
+        xs = np.arange(n, dtype=float)
+    
+    # n_out - 2 buckets spanning the interior points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x = xs[next_start:next_end].mean()
+            avg_y = y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = xs[-1], y[-1]
+        
+        areas = np.abs(
+            (xs[a] - avg_x) * (y[start:end] - y[a])
+            - (xs[a] - xs[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(areas.argmax())
+        selected[i + 1] = a
+    
+    return x[selected], y[selected]
+
+
+def _scatter(x, y, **kwargs) -> go.Scattergl:
+    """Build a WebGL line/scatter trace so long series don't bog down the browser"""
+    if len(y) > _LTTB_THRESHOLD:
+        x, y = _lttb(x, y, _LTTB_POINTS)
+    
+    kwargs.setdefault('mode', 'lines+markers')
+    return go.Scattergl(x=x, y=y, **kwargs)
+
+
+# Static axes shared by the sample data builders
+_TREND_DATES = pd.date_range('2024-01-01', periods=30, freq='D').to_numpy()
+_HOURS = np.arange(24)
+_HOUR_LABELS = tuple(f"{h:02d}:00" for h in range(24))
+
+
+# Sample data builders. Streamlit reruns the whole script on every
+# interaction, so the constant frames are cached between reruns.
+
+@st.cache_data(ttl=30)
+def _sample_call_volume_df() -> pd.DataFrame:
+    """Hourly call volume for the last 24 hours"""
+    calls = [
+        15, 18, 12, 8, 5, 3, 2, 4, 8, 12,
+        20, 25, 30, 28, 24, 26, 22, 19, 17, 15,
+        12, 10, 8, 6
+    ]
+    
+    return pd.DataFrame({
+        'Hour': _HOUR_LABELS,
+        'Calls': calls
+    })
+
+
+@st.cache_data(ttl=30)
+def _sample_weekly_quality_df() -> pd.DataFrame:
+    """Daily quality scores for the last 7 days"""
+    days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    scores = [85, 87, 89, 86, 88, 90, 87]
+    
+    return pd.DataFrame({
+        'Day': days,
+        'Quality Score': scores
+    })
+
+
+@st.cache_data(ttl=10)
+def _sample_recent_activity() -> List[Dict[str, Any]]:
+    """Latest system events, newest first"""
+    return [
+        {"time": "2 min ago", "event": "📞 New call from +1-555-0123", "status": "active"},
+        {"time": "5 min ago", "event": "✅ Call CALL-001 completed with score 92", "status": "completed"},
+        {"time": "8 min ago", "event": "🔄 Call CALL-002 transferred to specialist", "status": "transferred"},
+        {"time": "12 min ago", "event": "⚠️ Call CALL-003 escalated to supervisor", "status": "escalated"},
+        {"time": "15 min ago", "event": "📊 Quality assessment completed for CALL-004", "status": "info"}
+    ]
+
+
+@st.cache_data(ttl=30)
+def _sample_active_calls() -> List[Dict[str, Any]]:
+    """Currently active and queued calls"""
+    return [
+        {
+            "Call ID": "CALL-001",
+            "Customer": "John Smith",
+            "Agent": "AI Agent 1",
+            "Duration": "00:03:45",
+            "Status": "🔴 Active",
+            "Priority": "High"
+        },
+        {
+            "Call ID": "CALL-002", 
+            "Customer": "Jane Doe",
+            "Agent": "Mike Johnson",
+            "Duration": "00:01:22",
+            "Status": "🔴 Active",
+            "Priority": "Normal"
+        },
+        {
+            "Call ID": "CALL-003",
+            "Customer": "Bob Wilson",
+            "Agent": "Queue",
+            "Duration": "00:00:45",
+            "Status": "🟡 Queued",
+            "Priority": "Urgent"
+        }
+    ]
+
+
+@st.cache_data(ttl=30)
+def _sample_agents() -> List[Dict[str, Any]]:
+    """Per-agent performance for today"""
+    return [
+        {
+            "Agent": "John Smith",
+            "Status": "🟢 Available",
+            "Calls Today": 12,
+            "Avg Quality": 89,
+            "Avg Duration": "4:32",
+            "Specialization": "Technical"
+        },
+        {
+            "Agent": "Jane Doe",
+            "Status": "🔴 On Call",
+            "Calls Today": 8,
+            "Avg Quality": 92,
+            "Avg Duration": "3:45",
+            "Specialization": "Billing"
+        },
+        {
+            "Agent": "AI Agent 1",
+            "Status": "🟢 Available",
+            "Calls Today": 25,
+            "Avg Quality": 85,
+            "Avg Duration": "2:15",
+            "Specialization": "General"
+        },
+        {
+            "Agent": "Mike Johnson",
+            "Status": "🔴 On Call",
+            "Calls Today": 10,
+            "Avg Quality": 88,
+            "Avg Duration": "5:20",
+            "Specialization": "Technical"
+        }
+    ]
+
+
+@st.cache_data(ttl=30)
+def _sample_quality_trend_df() -> pd.DataFrame:
+    """Daily quality scores for the last 30 days"""
+    i = np.arange(len(_TREND_DATES))
+    scores = 85 + (i % 10) + (i // 10) * 2 + np.where(i % 7 == 0, 5, 0)
+    
+    return pd.DataFrame({
+        'Date': _TREND_DATES,
+        'Quality Score': scores
+    })
+
+
+@st.cache_data(ttl=30)
+def _sample_quality_dimensions_df() -> pd.DataFrame:
+    """Average score per quality dimension"""
+    dimensions = [
+        'Greeting', 'Identity Verification', 'Issue Understanding',
+        'Solution Provided', 'Professionalism', 'Empathy', 'Compliance', 'Closure'
+    ]
+    scores = [92, 88, 85, 89, 91, 87, 95, 90]
+    
+    return pd.DataFrame({
+        'Dimension': dimensions,
+        'Score': scores
+    })
+
+
+@st.cache_data(ttl=30)
+def _sample_low_quality_calls() -> List[Dict[str, Any]]:
+    """Recent calls that scored below threshold"""
+    return [
+        {
+            "Call ID": "CALL-045",
+            "Agent": "John Smith", 
+            "Score": 65,
+            "Issues": "Incomplete verification, Poor closure",
+            "Action": "Coaching scheduled"
+        },
+        {
+            "Call ID": "CALL-067",
+            "Agent": "Jane Doe",
+            "Score": 72,
+            "Issues": "Lack of empathy, Rushed resolution",
+            "Action": "Manager review"
+        }
+    ]
+
+
+# Analytics queries, keyed on the selected date range. They return plain
+# tuples/arrays so cache hits are cheap to unpickle; figures are built after.
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_call_volume(start_date: date, end_date: date) -> Tuple[Tuple[str, ...], np.ndarray]:
+    """Average call volume per hour of day"""
+    calls = 10 + _HOURS + (_HOURS % 6) * 3
+    return _HOUR_LABELS, calls
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_performance(
+    start_date: date, end_date: date
+) -> Tuple[Tuple[str, ...], Tuple[float, ...], Tuple[int, ...]]:
+    """Average handle time (minutes) and resolution rate (%) per agent"""
+    agents = ("John", "Jane", "Mike", "AI Agent 1", "AI Agent 2")
+    times = (4.5, 3.8, 5.2, 2.1, 2.3)
+    rates = (94, 96, 89, 87, 92)
+    return agents, times, rates
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_outcomes(start_date: date, end_date: date) -> Tuple[Tuple[str, ...], Tuple[int, ...]]:
+    """Call counts per outcome"""
+    outcomes = ("Resolved", "Escalated", "Callback Scheduled", "Transferred", "Abandoned")
+    counts = (450, 75, 30, 45, 25)
+    return outcomes, counts
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_roi(start_date: date, end_date: date) -> Tuple[Tuple[str, str, str], ...]:
+    """ROI metrics as (label, value, delta)"""
+    return (
+        ("Cost per Call", "$12.50", "-$2.30"),
+        ("Agent Utilization", "87%", "+5%"),
+        ("Customer Satisfaction", "4.5/5", "+0.3"),
+        ("Monthly Savings", "$45,000", "+15%"),
+        ("Automation Rate", "35%", "+8%"),
+        ("Average Revenue", "$890", "+12%"),
+    )
+
+
+def _refresh_data() -> None:
+    """Drop cached data and figures so the current run rebuilds them"""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+# Static figures. st.plotly_chart only reads the figure, so one instance
+# is shared across sessions instead of being rebuilt on every rerun.
+
+@st.cache_resource(ttl=30)
+def _call_volume_figure() -> go.Figure:
+    """Hourly call volume line chart"""
+    df = _sample_call_volume_df()
+    
+    fig = go.Figure(_scatter(df['Hour'].to_numpy(), df['Calls'].to_numpy()))
+    fig.update_layout(
+        title="Hourly Call Volume",
+        xaxis_title='Hour',
+        yaxis_title='Calls',
+        height=400
+    )
+    return fig
+
+
+@st.cache_resource(ttl=30)
+def _weekly_quality_figure() -> go.Figure:
+    """Daily quality scores bar chart"""
+    df = _sample_weekly_quality_df()
+    
+    scores = df['Quality Score'].to_numpy()
+    fig = go.Figure(go.Bar(
+        x=df['Day'].to_numpy(),
+        y=scores,
+        marker=dict(color=scores, colorscale='RdYlGn', showscale=True)
+    ))
+    fig.update_layout(
+        title="Daily Quality Scores",
+        xaxis_title='Day',
+        yaxis_title='Quality Score',
+        height=400
+    )
+    return fig
+
+
+@st.cache_resource(ttl=30)
+def _quality_trend_figure() -> go.Figure:
+    """30-day quality score line chart with the target line"""
+    df = _sample_quality_trend_df()
+    
+    fig = go.Figure(_scatter(df['Date'].to_numpy(), df['Quality Score'].to_numpy()))
+    fig.update_layout(
+        title="Quality Score Trend (Last 30 Days)",
+        xaxis_title='Date',
+        yaxis_title='Quality Score'
+    )
+    fig.add_hline(y=85, line_dash="dash", annotation_text="Target (85)")
+    return fig
+
+
+@st.cache_resource(ttl=30)
+def _quality_dimensions_figure() -> go.Figure:
+    """Average score per dimension horizontal bar chart"""
+    df = _sample_quality_dimensions_df()
+    
+    scores = df['Score'].to_numpy()
+    fig = go.Figure(go.Bar(
+        x=scores,
+        y=df['Dimension'].to_numpy(),
+        orientation='h',
+        marker=dict(color=scores, colorscale='RdYlGn', showscale=True)
+    ))
+    fig.update_layout(
+        title="Average Scores by Dimension",
+        xaxis_title='Score',
+        yaxis_title='Dimension'
+    )
+    return fig
+
 
 class CallCenterDashboard:
     """Main dashboard for Call Center System"""
@@ -34,7 +381,9 @@ class CallCenterDashboard:
         """Run the dashboard"""
         try:
             self._initialize_db()
+            start = time.perf_counter()
             self._render_dashboard()
+            st.session_state['_render_ms'] = (time.perf_counter() - start) * 1000
         except Exception as e:
             st.error(f"Dashboard error: {e}")
             self.logger.error(f"Dashboard error: {e}")
@@ -97,20 +446,22 @@ class CallCenterDashboard:
             
             # Refresh controls
             st.subheader("🔄 Refresh")
-            if st.button("Refresh Data"):
-                st.experimental_rerun()
+            # Clicking already reruns the script; the callback clears the caches
+            # beforehand so that run renders fresh data without a second rerun
+            st.button("Refresh Data", on_click=_refresh_data)
             
             auto_refresh = st.checkbox("Auto Refresh (30s)")
             if auto_refresh:
-                # Auto-refresh every 30 seconds
-                import time
-                time.sleep(30)
-                st.experimental_rerun()
+                # Client-side timer; reruns every 30 seconds without blocking the worker
+                st_autorefresh(interval=30_000, key="auto_refresh")
             
             st.markdown("---")
             
             # System status
             self._render_system_status()
+            
+            if st.query_params.get("debug") == "1":
+                self._render_debug_panel()
     
     def _render_system_status(self) -> None:
         """Render system status in sidebar"""
@@ -131,24 +482,56 @@ class CallCenterDashboard:
         except Exception as e:
             st.error("Unable to fetch system status")
     
+    def _render_debug_panel(self) -> None:
+        """Render cache and render-time diagnostics (enabled with ?debug=1)"""
+        with st.expander("🛠 Debug", expanded=False):
+            last_render = st.session_state.get('_render_ms')
+            if last_render is not None:
+                st.text(f"Last render: {last_render:.1f}ms")
+            
+            try:
+                from streamlit.runtime.caching import (
+                    get_data_cache_stats_provider,
+                    get_resource_cache_stats_provider
+                )
+            except ImportError:
+                st.caption("Cache stats unavailable in this Streamlit version")
+                return
+            
+            for label, provider in (
+                ("cache_data", get_data_cache_stats_provider()),
+                ("cache_resource", get_resource_cache_stats_provider())
+            ):
+                # One stat per cached entry; newer Streamlit groups them by
+                # metric family. Aggregate them per cached function.
+                stats = provider.get_stats()
+                if isinstance(stats, dict):
+                    stats = [stat for family in stats.values() for stat in family]
+                
+                totals: Dict[str, List[int]] = {}
+                for stat in stats:
+                    name = stat.cache_name.rsplit('.', 1)[-1]
+                    entry = totals.setdefault(name, [0, 0])
+                    entry[0] += 1
+                    entry[1] += stat.byte_length
+                
+                lines = [
+                    f"{name}: {count} entries, {size / 1024:.1f} KiB"
+                    for name, (count, size) in sorted(totals.items())
+                ]
+                st.text(f"{label}\n" + ("\n".join(lines) or "(empty)"))
+    
     def _render_overview(self) -> None:
         """Render overview dashboard"""
         st.header("📈 System Overview")
         
         # Key metrics row
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            self._render_metric_card("Active Calls", 12, "📞", "+2 from last hour")
-        
-        with col2:
-            self._render_metric_card("Available Agents", 8, "👥", "2 specialists online")
-        
-        with col3:
-            self._render_metric_card("Avg Quality Score", 87, "⭐", "+5% this week")
-        
-        with col4:
-            self._render_metric_card("Resolution Rate", "94%", "✅", "+2% this month")
+        self._metric_row([
+            ("Active Calls", 12, "📞", "+2 from last hour"),
+            ("Available Agents", 8, "👥", "2 specialists online"),
+            ("Avg Quality Score", 87, "⭐", "+5% this week"),
+            ("Resolution Rate", "94%", "✅", "+2% this month")
+        ])
         
         st.markdown("---")
         
@@ -173,39 +556,32 @@ class CallCenterDashboard:
         col1, col2, col3 = st.columns([2, 1, 1])
         
         with col1:
-            search = st.text_input("🔍 Search calls", placeholder="Call ID, customer name, or phone")
+            st.text_input(
+                "🔍 Search calls",
+                placeholder="Call ID, customer name, or phone",
+                key='calls_search'
+            )
         
         with col2:
-            status_filter = st.selectbox("Status", ["All", "Active", "Queued", "Completed"])
+            st.selectbox("Status", ["All", "Active", "Queued", "Completed"], key='calls_status')
         
         with col3:
-            priority_filter = st.selectbox("Priority", ["All", "Urgent", "High", "Normal", "Low"])
+            st.selectbox("Priority", ["All", "Urgent", "High", "Normal", "Low"], key='calls_priority')
         
         # Active calls table
         st.subheader("🔴 Active Calls")
         self._render_active_calls_table()
-        
-        st.markdown("---")
-        
-        # Call details
-        if st.session_state.get('selected_call'):
-            self._render_call_details(st.session_state.selected_call)
     
     def _render_agents(self) -> None:
         """Render agents page"""
         st.header("👥 Agents")
         
         # Agent status overview
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            self._render_metric_card("Total Agents", 15, "👥", "3 new this month")
-        
-        with col2:
-            self._render_metric_card("Available", 8, "🟢", "53% utilization")
-        
-        with col3:
-            self._render_metric_card("Average Rating", 4.2, "⭐", "out of 5.0")
+        self._metric_row([
+            ("Total Agents", 15, "👥", "3 new this month"),
+            ("Available", 8, "🟢", "53% utilization"),
+            ("Average Rating", 4.2, "⭐", "out of 5.0")
+        ])
         
         # Agent performance table
         st.subheader("📊 Agent Performance")
@@ -225,19 +601,12 @@ class CallCenterDashboard:
         st.header("⭐ Quality Management")
         
         # Quality metrics
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            self._render_metric_card("Avg Score", 87, "⭐", "+2 points")
-        
-        with col2:
-            self._render_metric_card("Compliance", "96%", "✅", "+1% this week")
-        
-        with col3:
-            self._render_metric_card("Coaching Needed", 3, "📚", "2 urgent")
-        
-        with col4:
-            self._render_metric_card("Customer Satisfaction", "4.5/5", "😊", "+0.2 this month")
+        self._metric_row([
+            ("Avg Score", 87, "⭐", "+2 points"),
+            ("Compliance", "96%", "✅", "+1% this week"),
+            ("Coaching Needed", 3, "📚", "2 urgent"),
+            ("Customer Satisfaction", "4.5/5", "😊", "+0.2 this month")
+        ])
         
         # Quality trends
         st.subheader("📈 Quality Trends")
@@ -300,124 +669,80 @@ class CallCenterDashboard:
         with tab3:
             self._render_quality_settings()
     
-    def _render_metric_card(self, title: str, value: Any, icon: str, subtitle: str = "") -> None:
-        """Render a metric card"""
-        st.metric(
-            label=f"{icon} {title}",
-            value=str(value),
-            delta=subtitle if subtitle else None
-        )
+    def _metric_row(self, items: List[Tuple[str, Any, str, str]]) -> None:
+        """Render a row of metric cards from (title, value, icon, subtitle) tuples"""
+        for col, (title, value, icon, subtitle) in zip(st.columns(len(items)), items):
+            col.metric(
+                label=f"{icon} {title}",
+                value=str(value),
+                delta=subtitle or None
+            )
     
+    @st.fragment
     def _render_call_volume_chart(self) -> None:
         """Render call volume chart"""
         st.subheader("📊 Call Volume (Last 24 Hours)")
         
-        # Generate sample data
-        hours = list(range(24))
-        calls = [
-            15, 18, 12, 8, 5, 3, 2, 4, 8, 12,
-            20, 25, 30, 28, 24, 26, 22, 19, 17, 15,
-            12, 10, 8, 6
-        ]
-        
-        df = pd.DataFrame({
-            'Hour': [f"{h:02d}:00" for h in hours],
-            'Calls': calls
-        })
-        
-        fig = px.line(
-            df, x='Hour', y='Calls',
-            title="Hourly Call Volume",
-            markers=True
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_call_volume_figure(), use_container_width=True)
     
+    @st.fragment
     def _render_quality_trend_chart(self) -> None:
         """Render quality trend chart"""
         st.subheader("⭐ Quality Trends (Last 7 Days)")
         
-        # Generate sample data
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        scores = [85, 87, 89, 86, 88, 90, 87]
-        
-        df = pd.DataFrame({
-            'Day': days,
-            'Quality Score': scores
-        })
-        
-        fig = px.bar(
-            df, x='Day', y='Quality Score',
-            title="Daily Quality Scores",
-            color='Quality Score',
-            color_continuous_scale='RdYlGn'
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_weekly_quality_figure(), use_container_width=True)
     
+    @st.fragment
     def _render_recent_activity(self) -> None:
         """Render recent activity list"""
-        activities = [
-            {"time": "2 min ago", "event": "📞 New call from +1-555-0123", "status": "active"},
-            {"time": "5 min ago", "event": "✅ Call CALL-001 completed with score 92", "status": "completed"},
-            {"time": "8 min ago", "event": "🔄 Call CALL-002 transferred to specialist", "status": "transferred"},
-            {"time": "12 min ago", "event": "⚠️ Call CALL-003 escalated to supervisor", "status": "escalated"},
-            {"time": "15 min ago", "event": "📊 Quality assessment completed for CALL-004", "status": "info"}
-        ]
-        
-        for activity in activities:
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.text(activity["event"])
-                with col2:
-                    st.caption(activity["time"])
-                st.divider()
+        # One markdown table instead of a container, columns and divider per row
+        rows = "\n".join(
+            f"| {activity['event']} | {activity['time']} |"
+            for activity in _sample_recent_activity()
+        )
+        st.markdown(f"| Event | Time |\n|---|---|\n{rows}")
     
+    @st.fragment
     def _render_active_calls_table(self) -> None:
-        """Render active calls table"""
-        # Sample data
-        calls_data = [
-            {
-                "Call ID": "CALL-001",
-                "Customer": "John Smith",
-                "Agent": "AI Agent 1",
-                "Duration": "00:03:45",
-                "Status": "🔴 Active",
-                "Priority": "High"
-            },
-            {
-                "Call ID": "CALL-002", 
-                "Customer": "Jane Doe",
-                "Agent": "Mike Johnson",
-                "Duration": "00:01:22",
-                "Status": "🔴 Active",
-                "Priority": "Normal"
-            },
-            {
-                "Call ID": "CALL-003",
-                "Customer": "Bob Wilson",
-                "Agent": "Queue",
-                "Duration": "00:00:45",
-                "Status": "🟡 Queued",
-                "Priority": "Urgent"
-            }
-        ]
+        """Render active calls table and details for the selected call.
         
-        df = pd.DataFrame(calls_data)
+        Runs as a fragment so selecting a row or toggling the transcript
+        only reruns this section; filters are read from session state.
+        """
+        calls = _sample_active_calls()
+        
+        search = st.session_state.get('calls_search', '').strip().lower()
+        status_filter = st.session_state.get('calls_status', 'All')
+        priority_filter = st.session_state.get('calls_priority', 'All')
+        
+        calls = [
+            call for call in calls
+            if (not search
+                or search in call["Call ID"].lower()
+                or search in call["Customer"].lower())
+            and (status_filter == "All" or call["Status"].endswith(status_filter))
+            and (priority_filter == "All" or call["Priority"] == priority_filter)
+        ]
         
         # Interactive table with selection
         selected_row = st.dataframe(
-            df,
+            calls,
             use_container_width=True,
             hide_index=True,
             on_select="rerun",
             selection_mode="single-row"
         )
         
+        selected_call = st.session_state.get('selected_call')
         if selected_row.selection.rows:
-            selected_call_id = df.iloc[selected_row.selection.rows[0]]["Call ID"]
-            st.session_state.selected_call = selected_call_id
+            selected_call = calls[selected_row.selection.rows[0]]["Call ID"]
+            st.session_state.selected_call = selected_call
+        
+        st.markdown("---")
+        
+        # Call details
+        if selected_call:
+            self._render_call_details(selected_call)
     
     def _render_call_details(self, call_id: str) -> None:
         """Render detailed call information"""
@@ -425,32 +750,41 @@ class CallCenterDashboard:
         
         col1, col2 = st.columns(2)
         
+        # Each block is one markdown element; trailing double spaces are line breaks
         with col1:
-            st.markdown("**Customer Information**")
-            st.text("Name: John Smith")
-            st.text("Phone: +1-555-0123")
-            st.text("Account: ACC-12345")
-            st.text("Language: English")
+            st.markdown(
+                "**Customer Information**  \n"
+                "Name: John Smith  \n"
+                "Phone: +1-555-0123  \n"
+                "Account: ACC-12345  \n"
+                "Language: English"
+            )
             
-            st.markdown("**Call Information**")
-            st.text("Started: 10:45 AM")
-            st.text("Duration: 00:03:45")
-            st.text("Priority: High")
-            st.text("Category: Technical Support")
+            st.markdown(
+                "**Call Information**  \n"
+                "Started: 10:45 AM  \n"
+                "Duration: 00:03:45  \n"
+                "Priority: High  \n"
+                "Category: Technical Support"
+            )
         
         with col2:
             st.markdown("**Real-time Summary**")
             st.info("Customer reporting login issues with mobile app. Agent provided troubleshooting steps.")
             
-            st.markdown("**Key Points**")
-            st.text("• App crashes on startup")
-            st.text("• Already tried basic restart")
-            st.text("• Account verified successfully")
+            st.markdown(
+                "**Key Points**  \n"
+                "• App crashes on startup  \n"
+                "• Already tried basic restart  \n"
+                "• Account verified successfully"
+            )
             
-            st.markdown("**Action Items**")
-            st.text("• Clear app cache")
-            st.text("• Update to latest version")
-            st.text("• Follow up in 24 hours")
+            st.markdown(
+                "**Action Items**  \n"
+                "• Clear app cache  \n"
+                "• Update to latest version  \n"
+                "• Follow up in 24 hours"
+            )
         
         # Real-time transcript (if available)
         if st.checkbox("Show Live Transcript"):
@@ -464,45 +798,10 @@ class CallCenterDashboard:
             """
             st.code(transcript_text, language=None)
     
+    @st.fragment
     def _render_agent_performance_table(self) -> None:
         """Render agent performance table"""
-        agents_data = [
-            {
-                "Agent": "John Smith",
-                "Status": "🟢 Available",
-                "Calls Today": 12,
-                "Avg Quality": 89,
-                "Avg Duration": "4:32",
-                "Specialization": "Technical"
-            },
-            {
-                "Agent": "Jane Doe",
-                "Status": "🔴 On Call",
-                "Calls Today": 8,
-                "Avg Quality": 92,
-                "Avg Duration": "3:45",
-                "Specialization": "Billing"
-            },
-            {
-                "Agent": "AI Agent 1",
-                "Status": "🟢 Available",
-                "Calls Today": 25,
-                "Avg Quality": 85,
-                "Avg Duration": "2:15",
-                "Specialization": "General"
-            },
-            {
-                "Agent": "Mike Johnson",
-                "Status": "🔴 On Call",
-                "Calls Today": 10,
-                "Avg Quality": 88,
-                "Avg Duration": "5:20",
-                "Specialization": "Technical"
-            }
-        ]
-        
-        df = pd.DataFrame(agents_data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.dataframe(_sample_agents(), use_container_width=True, hide_index=True)
     
     def _render_agent_details(self, agent_name: str) -> None:
         """Render detailed agent information"""
@@ -527,173 +826,124 @@ class CallCenterDashboard:
         days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri']
         scores = [87, 89, 91, 88, 89]
         
-        fig = px.line(
-            x=days, y=scores,
-            title=f"Quality Trend - {agent_name}",
-            markers=True
-        )
+        fig = go.Figure(_scatter(days, scores))
+        fig.update_layout(title=f"Quality Trend - {agent_name}")
         st.plotly_chart(fig, use_container_width=True)
     
     def _render_quality_trends(self) -> None:
         """Render quality trends"""
-        # Sample data for quality trends
-        dates = pd.date_range('2024-01-01', periods=30, freq='D')
-        scores = [85 + (i % 10) + (i // 10) * 2 + (5 if i % 7 == 0 else 0) for i in range(30)]
-        
-        df = pd.DataFrame({
-            'Date': dates,
-            'Quality Score': scores
-        })
-        
-        fig = px.line(
-            df, x='Date', y='Quality Score',
-            title="Quality Score Trend (Last 30 Days)",
-            markers=True
-        )
-        fig.add_hline(y=85, line_dash="dash", annotation_text="Target (85)")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_quality_trend_figure(), use_container_width=True)
     
     def _render_quality_dimensions_chart(self) -> None:
         """Render quality dimensions breakdown"""
         st.subheader("📊 Quality Dimensions")
         
-        dimensions = [
-            'Greeting', 'Identity Verification', 'Issue Understanding',
-            'Solution Provided', 'Professionalism', 'Empathy', 'Compliance', 'Closure'
-        ]
-        scores = [92, 88, 85, 89, 91, 87, 95, 90]
-        
-        df = pd.DataFrame({
-            'Dimension': dimensions,
-            'Score': scores
-        })
-        
-        fig = px.bar(
-            df, x='Score', y='Dimension', orientation='h',
-            title="Average Scores by Dimension",
-            color='Score',
-            color_continuous_scale='RdYlGn'
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_quality_dimensions_figure(), use_container_width=True)
     
     def _render_quality_distribution_chart(self) -> None:
         """Render quality score distribution"""
         st.subheader("📈 Score Distribution")
         
         # Generate sample distribution data
-        import numpy as np
         scores = np.random.normal(87, 8, 100).astype(int)
         scores = np.clip(scores, 0, 100)
         
-        fig = px.histogram(
-            x=scores,
-            nbins=20,
+        # Bin up front so the browser only receives the bar heights
+        counts, edges = np.histogram(scores, bins=20)
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges)
+        ))
+        fig.update_layout(
             title="Quality Score Distribution",
-            labels={'x': 'Quality Score', 'y': 'Count'}
+            xaxis_title='Quality Score',
+            yaxis_title='Count',
+            bargap=0
         )
         fig.add_vline(x=85, line_dash="dash", annotation_text="Target")
         st.plotly_chart(fig, use_container_width=True)
     
     def _render_low_quality_calls(self) -> None:
         """Render table of low quality calls"""
-        low_quality_data = [
-            {
-                "Call ID": "CALL-045",
-                "Agent": "John Smith", 
-                "Score": 65,
-                "Issues": "Incomplete verification, Poor closure",
-                "Action": "Coaching scheduled"
-            },
-            {
-                "Call ID": "CALL-067",
-                "Agent": "Jane Doe",
-                "Score": 72,
-                "Issues": "Lack of empathy, Rushed resolution",
-                "Action": "Manager review"
-            }
-        ]
-        
-        df = pd.DataFrame(low_quality_data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.dataframe(_sample_low_quality_calls(), use_container_width=True, hide_index=True)
     
+    @st.fragment
     def _render_call_volume_analytics(self, start_date, end_date) -> None:
         """Render call volume analytics"""
         st.subheader("📈 Call Volume Analysis")
         
-        # Generate sample hourly data
-        hours = list(range(24))
-        volume_data = [
-            {"Hour": f"{h:02d}:00", "Calls": 10 + h + (h % 6) * 3} 
-            for h in hours
-        ]
-        
-        df = pd.DataFrame(volume_data)
+        hour_labels, calls = _fetch_call_volume(start_date, end_date)
         
-        fig = px.bar(
-            df, x='Hour', y='Calls',
-            title="Average Hourly Call Volume"
+        fig = go.Figure(go.Bar(x=hour_labels, y=calls))
+        fig.update_layout(
+            title="Average Hourly Call Volume",
+            xaxis_title='Hour',
+            yaxis_title='Calls'
         )
         st.plotly_chart(fig, use_container_width=True)
     
+    @st.fragment
     def _render_performance_analytics(self, start_date, end_date) -> None:
         """Render performance analytics"""
         st.subheader("⏱️ Performance Metrics")
         
+        agents, times, rates = _fetch_performance(start_date, end_date)
+        
         col1, col2 = st.columns(2)
         
         with col1:
             # Average handle time
-            agents = ["John", "Jane", "Mike", "AI Agent 1", "AI Agent 2"]
-            times = [4.5, 3.8, 5.2, 2.1, 2.3]
-            
-            fig = px.bar(
-                x=agents, y=times,
+            fig = go.Figure(go.Bar(x=agents, y=times))
+            fig.update_layout(
                 title="Average Handle Time (minutes)",
-                labels={'x': 'Agent', 'y': 'Minutes'}
+                xaxis_title='Agent',
+                yaxis_title='Minutes'
             )
             st.plotly_chart(fig, use_container_width=True)
         
         with col2:
             # Resolution rates
-            rates = [94, 96, 89, 87, 92]
-            
-            fig = px.bar(
-                x=agents, y=rates,
+            fig = go.Figure(go.Bar(
+                x=agents,
+                y=rates,
+                marker=dict(color=rates, colorscale='RdYlGn', showscale=True)
+            ))
+            fig.update_layout(
                 title="Resolution Rate (%)",
-                labels={'x': 'Agent', 'y': 'Percentage'},
-                color=rates,
-                color_continuous_scale='RdYlGn'
+                xaxis_title='Agent',
+                yaxis_title='Percentage'
             )
             st.plotly_chart(fig, use_container_width=True)
     
+    @st.fragment
     def _render_outcome_analytics(self, start_date, end_date) -> None:
         """Render outcome analytics"""
         st.subheader("🎯 Call Outcomes")
         
-        outcomes = ["Resolved", "Escalated", "Callback Scheduled", "Transferred", "Abandoned"]
-        counts = [450, 75, 30, 45, 25]
+        outcomes, counts = _fetch_outcomes(start_date, end_date)
         
-        fig = px.pie(
-            values=counts, names=outcomes,
-            title="Call Outcome Distribution"
-        )
+        fig = go.Figure(go.Pie(values=counts, labels=outcomes))
+        fig.update_layout(title="Call Outcome Distribution")
         st.plotly_chart(fig, use_container_width=True)
     
+    @st.fragment
     def _render_roi_analytics(self, start_date, end_date) -> None:
         """Render ROI analytics"""
         st.subheader("💰 Return on Investment")
         
+        metrics = _fetch_roi(start_date, end_date)
+        half = (len(metrics) + 1) // 2
+        
         col1, col2 = st.columns(2)
         
         with col1:
-            st.metric("Cost per Call", "$12.50", "-$2.30")
-            st.metric("Agent Utilization", "87%", "+5%")
-            st.metric("Customer Satisfaction", "4.5/5", "+0.3")
+            for label, value, delta in metrics[:half]:
+                st.metric(label, value, delta)
         
         with col2:
-            st.metric("Monthly Savings", "$45,000", "+15%")
-            st.metric("Automation Rate", "35%", "+8%")
-            st.metric("Average Revenue", "$890", "+12%")
+            for label, value, delta in metrics[half:]:
+                st.metric(label, value, delta)
     
     def _render_system_settings(self) -> None:
         """Render system settings"""
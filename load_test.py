@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """Load testing script for the AI Call Center API"""
 
-import requests
-import threading
+import asyncio
+import sys
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is not part of the minimal requirements
+    aiohttp = None
 
 BASE_URL = "http://localhost:8000"
 
-def create_test_call(call_number):
-    """Create a test call"""
-    call_data = {
+def build_call_data(call_number):
+    """Build the payload for a test call"""
+    return {
         "customer_phone": f"+1-555-{random.randint(1000, 9999)}",
         "priority": random.choice(["low", "normal", "high"]),
         "metadata": {
@@ -19,9 +25,45 @@ def create_test_call(call_number):
             "timestamp": time.time()
         }
     }
+
+async def create_test_call(session, call_number):
+    """Create a test call"""
+    call_data = build_call_data(call_number)
+    
+    try:
+        async with session.post(f"{BASE_URL}/api/v1/calls", json=call_data) as response:
+            if response.status == 200:
+                result = await response.json()
+                print(f"✅ Call {call_number}: {result['call']['call_id']}")
+            else:
+                print(f"❌ Call {call_number}: Failed ({response.status})")
+    except Exception as e:
+        print(f"❌ Call {call_number}: Error - {e}")
+
+async def load_test(num_calls=10, concurrency=5):
+    """Run load test with multiple concurrent calls"""
+    print(f"🚀 Starting load test: {num_calls} calls with {concurrency} concurrent connections")
+    print("-" * 50)
+    
+    start_time = time.time()
+    
+    # One pooled session for all calls; the connector limit caps concurrency
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*[
+            create_test_call(session, call_num)
+            for call_num in range(1, num_calls + 1)
+        ])
+    
+    end_time = time.time()
+    print(f"\n⏱️ Load test completed in {end_time - start_time:.2f} seconds")
+
+def create_test_call_sync(session, call_number):
+    """Create a test call with a blocking requests session"""
+    call_data = build_call_data(call_number)
     
     try:
-        response = requests.post(f"{BASE_URL}/api/v1/calls", json=call_data)
+        response = session.post(f"{BASE_URL}/api/v1/calls", json=call_data)
         if response.status_code == 200:
             result = response.json()
             print(f"✅ Call {call_number}: {result['call']['call_id']}")
@@ -30,31 +72,31 @@ def create_test_call(call_number):
     except Exception as e:
         print(f"❌ Call {call_number}: Error - {e}")
 
-def load_test(num_calls=10, num_threads=5):
-    """Run load test with multiple concurrent calls"""
+def load_test_sync(num_calls=10, num_threads=5):
+    """Run load test from a thread pool sharing one keep-alive session"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    
     print(f"🚀 Starting load test: {num_calls} calls with {num_threads} threads")
     print("-" * 50)
     
     start_time = time.time()
-    threads = []
-    
-    # Create calls in batches
-    for i in range(0, num_calls, num_threads):
-        batch_threads = []
-        for j in range(min(num_threads, num_calls - i)):
-            call_num = i + j + 1
-            thread = threading.Thread(target=create_test_call, args=(call_num,))
-            batch_threads.append(thread)
-            thread.start()
-        
-        # Wait for batch to complete
-        for thread in batch_threads:
-            thread.join()
-        
-        time.sleep(0.1)  # Small delay between batches
+    
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=num_threads, pool_maxsize=num_threads * 2))
+    
+    with session, ThreadPoolExecutor(max_workers=num_threads) as executor:
+        list(executor.map(
+            lambda call_num: create_test_call_sync(session, call_num),
+            range(1, num_calls + 1)
+        ))
     
     end_time = time.time()
     print(f"\n⏱️ Load test completed in {end_time - start_time:.2f} seconds")
 
 if __name__ == "__main__":
-    load_test(20, 5)  # Create 20 calls with 5 concurrent threads
\ No newline at end of file
+    # Create 20 calls over 5 pooled connections; --sync forces the threaded client
+    if aiohttp is None or "--sync" in sys.argv:
+        load_test_sync(20, 5)
+    else:
+        asyncio.run(load_test(20, 5))
@@ -1,21 +1,44 @@
 """Main application entry point for Call Center AI System"""
 
 import asyncio
+import contextlib
+import copy
+import functools
+import importlib
 import sys
 import signal
-from typing import Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Awaitable, Callable, List, Mapping, Optional, Tuple
 from pathlib import Path
 import uvicorn
 import click
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+# uvloop is a faster drop-in event loop; it is not available on Windows
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import httptools  # noqa: F401
+    _HTTP_PARSER = "httptools"
+except ImportError:
+    _HTTP_PARSER = "h11"
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from config.settings import settings
-from core import setup_logging, get_logger, AgentConfig
-from core.base_agent import BaseAgent
+from core import setup_logging, get_logger, AgentConfig, AGENT_REGISTRY
+from core.base_agent import BaseAgent, Message
+from core.exceptions import CommunicationException
 from database import initialize_database, get_database
 from communication import MessageBus, MessageBrokerType, EventSystem
+# Importing the agent modules registers their classes in AGENT_REGISTRY
 from agents.intake_agent import IntakeAgent
 from agents.transcription_agent import TranscriptionAgent
 from agents.summarization_agent import SummarizationAgent
@@ -23,21 +46,114 @@ from agents.quality_score_agent import QualityScoringAgent
 from agents.routing_agent import RoutingAgent
 
 
+@functools.lru_cache(maxsize=1)
+def _build_agent_configs() -> Mapping[str, AgentConfig]:
+    """Build the per-agent configuration once; custom configs are read-only"""
+    return MappingProxyType({
+        "IntakeAgent": AgentConfig(
+            name="IntakeAgent",
+            type="intake",
+            custom_config=MappingProxyType({
+                "company_name": settings.app_name,
+                "enable_telephony": bool(settings.twilio_account_sid),
+                "greeting_template": "Thank you for calling {company_name}. My name is {agent_name}. How may I assist you today?"
+            })
+        ),
+        "TranscriptionAgent": AgentConfig(
+            name="TranscriptionAgent", 
+            type="transcription",
+            prefetch_count=32,
+            custom_config=MappingProxyType({
+                "provider": "deepgram" if settings.deepgram_api_key else "whisper",
+                "deepgram_api_key": settings.deepgram_api_key,
+                "language": settings.transcription_language
+            })
+        ),
+        "SummarizationAgent": AgentConfig(
+            name="SummarizationAgent",
+            type="summarization",
+            # Summaries are independent and wait on the LLM, so overlap them
+            concurrency=8,
+            custom_config=MappingProxyType({
+                "openai_api_key": settings.openai_api_key,
+                "model": settings.openai_model,
+                "max_summary_length": settings.summary_max_length
+            })
+        ),
+        "QualityScoringAgent": AgentConfig(
+            name="QualityScoringAgent",
+            type="quality_scoring"
+        ),
+        "RoutingAgent": AgentConfig(
+            name="RoutingAgent",
+            type="routing",
+            custom_config=MappingProxyType({
+                "max_queue_time": 300,
+                "auto_resolve_threshold": 0.8,
+                "escalation_threshold": 0.3
+            })
+        )
+    })
+
+
+# Provider SDKs the agents load; they are optional and slow to import
+_WARM_MODULES = ("openai", "deepgram", "twilio.rest")
+
+
+def _import_optional(module_name: str) -> None:
+    """Import a module if it is installed"""
+    try:
+        importlib.import_module(module_name)
+    except ImportError:
+        pass
+
+
+def _warm_imports() -> None:
+    """Import the heavy provider SDKs in parallel so agent init finds them cached"""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_import_optional, _WARM_MODULES))
+
+
+async def _run_concurrently(*coros) -> None:
+    """Run coroutines concurrently, cancelling the rest if one fails"""
+    if not hasattr(asyncio, "TaskGroup"):
+        # Python < 3.11
+        await asyncio.gather(*coros)
+        return
+    
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for coro in coros:
+                tg.create_task(coro)
+    except BaseExceptionGroup as eg:
+        # Surface the first failure, as callers expect a plain exception
+        raise eg.exceptions[0]
+
+
 class CallCenterSystem:
     """Main system orchestrator"""
     
     def __init__(self):
         self.logger = get_logger(__name__)
         self.agents: Dict[str, BaseAgent] = {}
+        self._factories: Dict[str, Callable[[], BaseAgent]] = {}
         self.message_bus: Optional[MessageBus] = None
         self.event_system: Optional[EventSystem] = None
         self.is_running = False
+        self._stop_event: Optional[asyncio.Event] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+        self._shutdown_hooks: List[Callable[[], Awaitable[None]]] = []
+        
+        # Short-lived status snapshot so frequent polling doesn't rebuild it
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_ttl = 0.5
         
         # Setup logging
         setup_logging(
             log_level=settings.log_level,
             log_file=settings.log_file,
-            json_format=settings.is_production
+            json_format=settings.is_production,
+            record_process_info=not settings.is_production
         )
     
     async def initialize(self) -> None:
@@ -45,16 +161,19 @@ class CallCenterSystem:
         try:
             self.logger.info("Initializing Call Center AI System...")
             
-            # Initialize database
-            await self._initialize_database()
+            # Created here so the event belongs to the running loop
+            self._stop_event = asyncio.Event()
             
-            # Initialize message bus
-            await self._initialize_message_bus()
-            
-            # Initialize event system
-            await self._initialize_event_system()
+            # Database, message bus and event system are independent; the
+            # blocking SDK imports run on a thread alongside them
+            await _run_concurrently(
+                asyncio.to_thread(_warm_imports),
+                self._initialize_database(),
+                self._initialize_message_bus(),
+                self._initialize_event_system()
+            )
             
-            # Initialize and register agents
+            # Initialize and register agents (needs the message bus)
             await self._initialize_agents()
             
             # Setup signal handlers
@@ -75,27 +194,47 @@ class CallCenterSystem:
             redis_url=settings.redis_url
         )
         
-        # Test database connection
+        # Test database connection; sessions are lazy, so run a real query
         db = get_database()
         async with db.get_session() as session:
-            self.logger.info("Database connection established")
+            await session.execute(text("SELECT 1"))
+        
+        # Warm half of the pool the engine was actually built with
+        if make_url(settings.database_url).drivername == "postgresql+asyncpg":
+            await db.warm_pool(db.engine.pool.size() // 2)
+        
+        self.logger.info("Database connection established")
     
     async def _initialize_message_bus(self) -> None:
         """Initialize message bus for inter-agent communication"""
         self.logger.info("Initializing message bus...")
         
         # Determine broker type based on configuration
-        if settings.rabbitmq_url:
+        if settings.testing:
+            broker_type = MessageBrokerType.MEMORY
+            connection_config = {}
+        elif settings.rabbitmq_url:
             broker_type = MessageBrokerType.RABBITMQ
             connection_config = {"url": settings.rabbitmq_url}
         elif settings.redis_url:
             broker_type = MessageBrokerType.REDIS
             connection_config = {"url": settings.redis_url}
+        elif settings.is_production:
+            raise CommunicationException(
+                "No message broker configured; set RABBITMQ_URL (or REDIS_URL) in production"
+            )
         else:
+            # Local runs without Docker clear REDIS_URL; keep them working in one process
+            self.logger.warning(
+                "No message broker configured, falling back to the in-memory broker. "
+                "Set RABBITMQ_URL to run agents as separate replicas."
+            )
             broker_type = MessageBrokerType.MEMORY
             connection_config = {}
         
-        self.message_bus = MessageBus(broker_type, connection_config)
+        # Pooled broker connections shared by all agent subscriptions
+        pool_size = max(2, len(AGENT_REGISTRY) // 4)
+        self.message_bus = MessageBus(broker_type, connection_config, pool_size=pool_size)
         await self.message_bus.initialize()
         
         self.logger.info(f"Message bus initialized with {broker_type.value} broker")
@@ -110,106 +249,109 @@ class CallCenterSystem:
         """Initialize all agents"""
         self.logger.info("Initializing agents...")
         
-        # Agent configurations
-        agent_configs = {
-            "IntakeAgent": AgentConfig(
-                name="IntakeAgent",
-                type="intake",
-                custom_config={
-                    "company_name": settings.app_name,
-                    "enable_telephony": bool(settings.twilio_account_sid),
-                    "greeting_template": "Thank you for calling {company_name}. My name is {agent_name}. How may I assist you today?"
-                }
-            ),
-            "TranscriptionAgent": AgentConfig(
-                name="TranscriptionAgent", 
-                type="transcription",
-                custom_config={
-                    "provider": "deepgram" if settings.deepgram_api_key else "whisper",
-                    "deepgram_api_key": settings.deepgram_api_key,
-                    "language": settings.transcription_language
-                }
-            ),
-            "SummarizationAgent": AgentConfig(
-                name="SummarizationAgent",
-                type="summarization",
-                custom_config={
-                    "openai_api_key": settings.openai_api_key,
-                    "model": settings.openai_model,
-                    "max_summary_length": settings.summary_max_length
-                }
-            ),
-            "QualityScoringAgent": AgentConfig(
-                name="QualityScoringAgent",
-                type="quality_scoring"
-            ),
-            "RoutingAgent": AgentConfig(
-                name="RoutingAgent",
-                type="routing",
-                custom_config={
-                    "max_queue_time": 300,
-                    "auto_resolve_threshold": 0.8,
-                    "escalation_threshold": 0.3
-                }
-            )
+        # Bind each registered class to its config once; restarts reuse the factory
+        self._factories = {
+            agent_name: functools.partial(AGENT_REGISTRY[agent_name], config)
+            for agent_name, config in _build_agent_configs().items()
+            if agent_name in AGENT_REGISTRY
         }
         
-        # Initialize each agent
-        for agent_name, config in agent_configs.items():
-            try:
-                # Create agent instance
-                if agent_name == "IntakeAgent":
-                    agent = IntakeAgent(config)
-                elif agent_name == "TranscriptionAgent":
-                    agent = TranscriptionAgent(config)
-                elif agent_name == "SummarizationAgent":
-                    agent = SummarizationAgent(config)
-                elif agent_name == "QualityScoringAgent":
-                    agent = QualityScoringAgent(config)
-                elif agent_name == "RoutingAgent":
-                    agent = RoutingAgent(config)
-                else:
-                    continue
-                
-                # Initialize and start agent
-                await agent.initialize()
-                await agent.start()
-                
-                # Store agent reference
-                self.agents[agent_name] = agent
-                
-                # Subscribe agent to message bus
-                await self._subscribe_agent_to_bus(agent)
-                
-                self.logger.info(f"Agent {agent_name} initialized and started")
-                
-            except Exception as e:
-                self.logger.error(f"Failed to initialize agent {agent_name}: {e}")
-                raise
+        # Create agent instances
+        instances = [factory() for factory in self._factories.values()]
+        
+        # Agents are independent, so bring them up concurrently
+        await _run_concurrently(*(self._bring_up_agent(agent) for agent in instances))
+    
+    async def _bring_up_agent(self, agent: BaseAgent) -> None:
+        """Initialize, start and subscribe a single agent"""
+        try:
+            await agent.initialize()
+            await agent.start()
+            
+            # Store agent reference so shutdown stops it even if a sibling fails
+            self.agents[agent.name] = agent
+            
+            # Subscribe agent to message bus
+            await self._subscribe_agent_to_bus(agent)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize agent {agent.name}: {e}")
+            raise
+        
+        self.logger.info(f"Agent {agent.name} initialized and started")
     
     async def _subscribe_agent_to_bus(self, agent: BaseAgent) -> None:
         """Subscribe agent to appropriate message bus topics"""
-        # Subscribe to agent-specific topics
-        agent_topic = f"agent_{agent.name.lower()}"
-        await self.message_bus.subscribe(
-            agent_topic,
-            agent.receive_message
-        )
+        agent_name = agent.name
         
-        # Subscribe to broadcast topics
-        await self.message_bus.subscribe(
-            "broadcast",
-            agent.receive_message
+        # Deliver to whichever instance is registered under the name, so
+        # restart_agent can swap instances without re-subscribing
+        async def deliver(message: Message) -> None:
+            await self.agents[agent_name].receive_message(message)
+        
+        # Subscribe to agent-specific topics; the queue is shared so that
+        # replicas of the same agent (e.g. transcription workers) split the work
+        # Both subscriptions target different queues, so set them up together
+        agent_topic = f"agent_{agent_name.lower()}"
+        await _run_concurrently(
+            self.message_bus.subscribe(
+                agent_topic,
+                deliver,
+                shared=True,
+                prefetch_count=agent.prefetch_count
+            ),
+            # Subscribe to broadcast topics; every agent instance gets its own copy
+            self.message_bus.subscribe(
+                "broadcast",
+                deliver
+            )
         )
     
+    async def restart_agent(self, agent_name: str) -> BaseAgent:
+        """Replace an agent with a fresh instance built from its cached factory"""
+        if agent_name not in self._factories:
+            raise KeyError(f"Unknown agent: {agent_name}")
+        
+        old_agent = self.agents.get(agent_name)
+        if old_agent:
+            try:
+                await old_agent.stop()
+            except Exception as e:
+                self.logger.error(f"Error stopping agent {agent_name}: {e}")
+        
+        agent = self._factories[agent_name]()
+        await agent.initialize()
+        if old_agent:
+            # Take over the old queue: its messages are already acked, and
+            # deliveries blocked on it while full resume into the new agent
+            agent.message_queue = old_agent.message_queue
+        await agent.start()
+        self.agents[agent_name] = agent
+        self._status_cache = None
+        
+        self.logger.info(f"Agent {agent_name} restarted")
+        return agent
+    
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown"""
-        def signal_handler(signum, frame):
-            self.logger.info(f"Received signal {signum}, initiating shutdown...")
-            asyncio.create_task(self.shutdown())
-        
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        loop = asyncio.get_running_loop()
+        if sys.platform != "win32":
+            # Loop-native handlers run as regular callbacks on the event loop
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                loop.add_signal_handler(sig, lambda s=sig: self._handle_signal(s))
+        else:
+            # Windows has no add_signal_handler; hand the signal over to the
+            # loop instead of creating a task from inside the raw handler
+            def signal_handler(signum, frame):
+                loop.call_soon_threadsafe(self._handle_signal, signum)
+            
+            signal.signal(signal.SIGINT, signal_handler)
+            signal.signal(signal.SIGTERM, signal_handler)
+    
+    def _handle_signal(self, signum: int) -> None:
+        """Start a graceful shutdown from a signal callback"""
+        self.logger.info(f"Received signal {signum}, initiating shutdown...")
+        self._begin_shutdown()
     
     async def start(self) -> None:
         """Start the system"""
@@ -227,51 +369,97 @@ class CallCenterSystem:
         
         self.logger.info("Call Center AI System is running")
         
-        # Keep the system running
+        # Keep the system running until shutdown() is triggered
         try:
-            while self.is_running:
-                await asyncio.sleep(1)
+            await self.wait_for_shutdown()
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
         finally:
             await self.shutdown()
     
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Register a coroutine function to await at shutdown, before the agents are stopped"""
+        self._shutdown_hooks.append(hook)
+    
+    def _begin_shutdown(self) -> asyncio.Task:
+        """Start the teardown once; every later caller gets the same task"""
+        # The loop only holds tasks weakly; keeping it lets shutdown()/wait_for_shutdown() await it
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.create_task(self._teardown())
+        return self._shutdown_task
+    
     async def shutdown(self) -> None:
-        """Shutdown the system gracefully"""
-        if not self.is_running:
-            return
-        
+        """Shutdown the system gracefully, waiting for a teardown already in progress"""
+        # Shielded so a cancelled caller doesn't abort the teardown half-way
+        await asyncio.shield(self._begin_shutdown())
+    
+    async def _teardown(self) -> None:
+        """Stop agents and subsystems, then release wait_for_shutdown()"""
         self.logger.info("Shutting down Call Center AI System...")
         self.is_running = False
+        self._status_cache = None
+        try:
+            for hook in self._shutdown_hooks:
+                try:
+                    await hook()
+                except Exception as e:
+                    self.logger.error(f"Error in shutdown hook: {e}")
+            
+            await self._stop_components()
+        finally:
+            # Only now: waiters must not return while teardown is still running
+            if self._stop_event is None:
+                self._stop_event = asyncio.Event()
+            self._stop_event.set()
         
-        # Stop all agents
-        for agent_name, agent in self.agents.items():
-            try:
-                await agent.stop()
+        self.logger.info("System shutdown complete")
+    
+    async def _stop_components(self) -> None:
+        """Stop all agents, then the message bus, event system and database"""
+        # Stop all agents concurrently
+        results = await asyncio.gather(
+            *(agent.stop() for agent in self.agents.values()),
+            return_exceptions=True
+        )
+        for agent_name, result in zip(self.agents.keys(), results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error stopping agent {agent_name}: {result}")
+            else:
                 self.logger.info(f"Agent {agent_name} stopped")
-            except Exception as e:
-                self.logger.error(f"Error stopping agent {agent_name}: {e}")
         
-        # Shutdown message bus
+        # Message bus, event system and database are independent subsystems
+        subsystems = {}
         if self.message_bus:
-            await self.message_bus.shutdown()
-        
-        # Shutdown event system
+            subsystems["message bus"] = self.message_bus.shutdown()
         if self.event_system:
-            await self.event_system.stop()
-        
-        # Shutdown database
+            subsystems["event system"] = self.event_system.stop()
         try:
-            db = get_database()
-            await db.shutdown()
+            subsystems["database"] = get_database().shutdown()
         except Exception as e:
             self.logger.error(f"Error shutting down database: {e}")
         
-        self.logger.info("System shutdown complete")
+        results = await asyncio.gather(*subsystems.values(), return_exceptions=True)
+        for subsystem, result in zip(subsystems.keys(), results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error shutting down {subsystem}: {result}")
+    
+    async def wait_for_shutdown(self) -> None:
+        """Block until shutdown() has completed"""
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+        await self._stop_event.wait()
+        
+        # Surface teardown errors from a signal-started shutdown
+        if self._shutdown_task is not None:
+            await self._shutdown_task
     
     def get_system_status(self) -> Dict[str, Any]:
-        """Get system status"""
-        return {
+        """Get system status, reusing a snapshot younger than the status TTL"""
+        now = time.monotonic()
+        if self._status_cache and now - self._status_cache[0] < self._status_ttl:
+            return copy.deepcopy(self._status_cache[1])
+        
+        status = {
             "is_running": self.is_running,
             "agents": {
                 name: agent.get_status() 
@@ -280,6 +468,41 @@ class CallCenterSystem:
             "message_bus": self.message_bus.get_metrics() if self.message_bus else None,
             "event_system": self.event_system.get_metrics() if self.event_system else None
         }
+        # The snapshot must not alias live agent state, and callers each get
+        # their own copy so mutating a result can't change what others see
+        self._status_cache = (now, copy.deepcopy(status))
+        return copy.deepcopy(self._status_cache[1])
+
+
+def run_async(coro) -> Any:
+    """Run a coroutine to completion on uvloop when available"""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _server_options(host: str, port: int) -> Dict[str, Any]:
+    """uvicorn options shared by the api and combined commands"""
+    return dict(
+        host=host,
+        port=port,
+        log_level=settings.log_level.lower(),
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http=_HTTP_PARSER
+    )
+
+
+class _EmbeddedServer(uvicorn.Server):
+    """uvicorn server that leaves SIGINT/SIGTERM to the CallCenterSystem sharing its loop"""
+    
+    def install_signal_handlers(self) -> None:
+        # uvicorn < 0.29
+        pass
+    
+    @contextlib.contextmanager
+    def capture_signals(self):
+        # uvicorn >= 0.29
+        yield
 
 
 # CLI Commands
@@ -293,27 +516,41 @@ def cli():
 @click.option('--host', default='0.0.0.0', help='Host to bind to')
 @click.option('--port', default=8000, help='Port to bind to')
 @click.option('--reload', is_flag=True, help='Enable auto-reload')
-def api(host, port, reload):
+@click.option('--workers', type=int, default=1, envvar='API_WORKERS', show_default=True, help='Worker processes (env: API_WORKERS)')
+def api(host, port, reload, workers):
     """Start the API server"""
+    reload = reload and settings.debug
+    workers = 1 if reload else workers
+    server_options = _server_options(host, port)
+    
+    if reload or workers > 1:
+        # Reload and multi-process modes need an import string so children can load the app
+        uvicorn.run("api.main:app", reload=reload, workers=workers, **server_options)
+        return
+    
     from api.main import app
     
-    uvicorn.run(
-        app,
-        host=host,
-        port=port,
-        reload=reload and settings.debug,
-        log_level=settings.log_level.lower()
-    )
+    config = uvicorn.Config(app, **server_options)
+    uvicorn.Server(config).run()
 
 
 @cli.command()
 def dashboard():
     """Start the Streamlit dashboard"""
-    import streamlit.web.cli as stcli
-    import sys
+    from streamlit.web import bootstrap
     
-    sys.argv = ["streamlit", "run", "frontend/dashboard.py"]
-    stcli.main()
+    # Keys use the CLI flag spelling ("server_port" -> server.port); None is ignored.
+    # gatherUsageStats=False also skips the usage-stats request on startup
+    flag_options = {
+        "server_port": 8501,
+        "server_address": "0.0.0.0",
+        "server_headless": True,
+        "server_runOnSave": False,
+        "server_fileWatcherType": "none" if settings.is_production else None,
+        "browser_gatherUsageStats": False
+    }
+    bootstrap.load_config_options(flag_options=flag_options)
+    bootstrap.run("frontend/dashboard.py", False, [], flag_options)
 
 
 @cli.command()
@@ -324,7 +561,55 @@ def system():
         await system.initialize()
         await system.start()
     
-    asyncio.run(run_system())
+    run_async(run_system())
+
+
+@cli.command()
+@click.option('--host', default='0.0.0.0', help='Host to bind to')
+@click.option('--port', default=8000, help='Port to bind to')
+def combined(host, port):
+    """Start the agent system and the API server in one process"""
+    async def run_combined():
+        system = CallCenterSystem()
+        await system.initialize()
+        
+        from api.main import app
+        
+        # The API picks up the system's database and message bus in its lifespan
+        app.state.system = system
+        server = _EmbeddedServer(uvicorn.Config(app, **_server_options(host, port)))
+        api_stopped = asyncio.Event()
+        
+        async def stop_api():
+            # Finish in-flight requests before the agents and database they use go away
+            server.should_exit = True
+            await api_stopped.wait()
+        
+        system.add_shutdown_hook(stop_api)
+        startup_failure = None
+        
+        async def serve_api():
+            nonlocal startup_failure
+            try:
+                await server.serve()
+            except SystemExit as e:
+                # uvicorn exits this way when startup fails; re-raised once the loop is done
+                startup_failure = e
+            finally:
+                api_stopped.set()
+                # The API stopped on its own (e.g. the port was taken): bring the agents down too
+                await system.shutdown()
+        
+        try:
+            await _run_concurrently(system.start(), serve_api())
+        finally:
+            # Don't return before the shared teardown has run to completion
+            await system.shutdown()
+        
+        if startup_failure is not None:
+            raise startup_failure
+    
+    run_async(run_combined())
 
 
 @cli.command()
@@ -335,7 +620,7 @@ def status():
 
 
 @cli.command()
-@click.option('--agent', help='Specific agent to start')
+@click.option('--agent', 'agent_name', help='Specific agent to start')
 def agent(agent_name):
     """Start a specific agent"""
     if not agent_name:
@@ -351,14 +636,13 @@ def agent(agent_name):
             click.echo(f"Starting agent: {agent_name}")
             
             try:
-                while True:
-                    await asyncio.sleep(1)
+                await system.wait_for_shutdown()
             except KeyboardInterrupt:
                 await agent_instance.stop()
         else:
             click.echo(f"Agent '{agent_name}' not found")
     
-    asyncio.run(run_agent())
+    run_async(run_agent())
 
 
 @cli.command()
@@ -1,25 +1,53 @@
 #!/usr/bin/env python3
 """Quick start script for local development"""
 
+import hashlib
+import shutil
 import subprocess
 import sys
 import os
 import time
 import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
+REQUIREMENTS_FILE = Path("requirements-minimal.txt")
+REQUIREMENTS_STAMP = Path(sys.prefix, ".requirements.sha256")
+
 def install_dependencies():
-    """Install minimal dependencies"""
+    """Install minimal dependencies, skipping pip when the requirements are unchanged"""
+    requirements_hash = hashlib.sha256(REQUIREMENTS_FILE.read_bytes()).hexdigest()
+    try:
+        if REQUIREMENTS_STAMP.read_text().strip() == requirements_hash:
+            print("✅ Dependencies up to date")
+            return True
+    except OSError:
+        pass
+    
     print("📦 Installing dependencies...")
+    if shutil.which("uv"):
+        # uv resolves and installs much faster than pip
+        cmd = ["uv", "pip", "install", "--python", sys.executable, "-r", str(REQUIREMENTS_FILE)]
+    else:
+        cmd = [
+            sys.executable, "-m", "pip", "install",
+            "--disable-pip-version-check", "--no-input", "--prefer-binary",
+            "-r", str(REQUIREMENTS_FILE)
+        ]
+    
     try:
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", "requirements-minimal.txt"
-        ], check=True)
+        subprocess.run(cmd, check=True)
         print("✅ Dependencies installed")
-        return True
     except subprocess.CalledProcessError:
         print("❌ Failed to install dependencies")
         return False
+    
+    try:
+        REQUIREMENTS_STAMP.write_text(requirements_hash)
+    except OSError:
+        # Read-only interpreter prefix: install again next time rather than fail
+        pass
+    return True
 
 def start_api_server():
     """Start the API server"""
@@ -50,14 +78,48 @@ def start_dashboard():
     
     return process
 
+def wait_for_first_exit(processes):
+    """Block until one of the child processes exits and return its name and exit code"""
+    if sys.platform != "win32":
+        by_pid = {process.pid: (name, process) for name, process in processes}
+        while True:
+            pid, status = os.waitpid(-1, 0)
+            if pid in by_pid:
+                name, process = by_pid[pid]
+                # The child is reaped here, so record the exit code on the Popen object
+                process.returncode = os.waitstatus_to_exitcode(status)
+                return name, process.returncode
+    
+    # No waitpid(-1) on Windows: wait on every child from a thread instead
+    executor = ThreadPoolExecutor(max_workers=len(processes))
+    futures = {executor.submit(process.wait): name for name, process in processes}
+    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+    executor.shutdown(wait=False)
+    future = done.pop()
+    return futures[future], future.result()
+
+def stop_processes(processes):
+    """Terminate any child processes that are still running"""
+    for name, process in processes:
+        if process.returncode is not None:
+            continue
+        try:
+            print(f"Stopping {name}...")
+            process.terminate()
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        except Exception as e:
+            print(f"Error stopping {name}: {e}")
+
 def main():
     """Main function"""
     print("🤖 AI Call Center System - Quick Start")
     print("=" * 50)
     
     # Check Python version
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8+ required")
+    if sys.version_info < (3, 9):
+        print("❌ Python 3.9+ required")
         return 1
     
     # Install dependencies
@@ -90,26 +152,19 @@ def main():
         print("\n⌨️  Press Ctrl+C to stop")
         print("=" * 50)
         
-        # Wait for interrupt
-        while True:
-            time.sleep(1)
-            
+        # Block until a service exits; a crashed API should not leave the dashboard hanging
+        name, returncode = wait_for_first_exit(processes)
+        print(f"\n⚠️  {name} exited with code {returncode}, stopping services...")
+        exit_code = 1
+        
     except KeyboardInterrupt:
         print("\n🛑 Stopping services...")
-        
-        for name, process in processes:
-            try:
-                print(f"Stopping {name}...")
-                process.terminate()
-                process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                process.kill()
-            except Exception as e:
-                print(f"Error stopping {name}: {e}")
-        
-        print("✅ All services stopped")
+        exit_code = 0
+    
+    stop_processes(processes)
+    print("✅ All services stopped")
     
-    return 0
+    return exit_code
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
@@ -2,15 +2,19 @@
 """Local development runner for Call Center AI System"""
 
 import asyncio
+import hashlib
+import json
 import subprocess
 import sys
 import time
 import os
+import platform
+import selectors
 import signal
+import socket
 from pathlib import Path
-import psutil
 import threading
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
@@ -22,11 +26,27 @@ from core import setup_logging, get_logger
 class LocalRunner:
     """Local development environment runner"""
     
-    def __init__(self):
+    CACHE_PATH = Path("data/.runner_cache.json")
+    PIP_STAMP_PATH = Path("data/.pip_install_stamp")
+    
+    def __init__(self, use_cache: bool = True):
         self.logger = get_logger(__name__)
         self.processes: Dict[str, subprocess.Popen] = {}
         self.running = False
         
+        # Probe results cached across launches (see _cache_get/_cache_set)
+        self._cache: Dict[str, Dict[str, Any]] = self._load_cache() if use_cache else {}
+        
+        # Ports seen accepting connections in this run, with monotonic expiry (see _is_service_available)
+        self._service_cache: Dict[tuple, float] = {}
+        
+        # One selector drains every child's output (None on Windows: pipes can't be selected)
+        self._selector = selectors.DefaultSelector() if sys.platform != "win32" else None
+        self._output_buffers: Dict[str, bytes] = {}
+        
+        # Lets the signal handler wake the monitor loop out of epoll (Linux only)
+        self._wake_fd = os.eventfd(0, os.EFD_NONBLOCK) if hasattr(os, "eventfd") else None
+        
         # Setup logging
         setup_logging(
             log_level="INFO",
@@ -38,33 +58,62 @@ class LocalRunner:
         """Check if required services are available"""
         self.logger.info("Checking dependencies...")
         
+        # Python is the interpreter running this script: check it in-process, not via a subprocess
+        if sys.version_info < (3, 9):
+            self.logger.error(f"❌ python: {platform.python_version()} (3.9+ required)")
+            return False
+        self.logger.info(f"✅ python: {platform.python_version()}")
+        
+        # Services are probed with a socket connect rather than spawning pg_isready/redis-cli.
+        # Only tool lookups carry a ttl: a port can open or close between launches, so
+        # services are always checked live
         dependencies = {
-            "python": {"cmd": [sys.executable, "--version"], "required": True},
-            "docker": {"cmd": ["docker", "--version"], "required": False},
-            "postgresql": {"cmd": ["pg_isready", "-h", "localhost", "-p", "5432"], "required": False},
-            "redis": {"cmd": ["redis-cli", "ping"], "required": False}
+            "docker": {"cmd": ["docker", "--version"], "required": False, "ttl": 3600},
+            "postgresql": {"address": ("localhost", 5432), "required": False},
+            "redis": {"address": ("localhost", 6379), "required": False}
+        }
+        
+        # Reuse recent tool results and only probe what has expired
+        keys = {
+            name: f"dependency:{name}:" + " ".join(config["cmd"])
+            for name, config in dependencies.items()
+            if "ttl" in config
         }
+        results = {}
+        for name, key in keys.items():
+            hit, value = self._cache_get(key)
+            if hit:
+                results[name] = value
+        
+        stale = [name for name in dependencies if name not in results]
+        
+        async def probe_all():
+            return await asyncio.gather(
+                *(self._probe_dependency(dependencies[name]) for name in stale)
+            )
+        
+        if stale:
+            for name, available in zip(stale, asyncio.run(probe_all())):
+                if name in keys:
+                    self._cache_set(keys[name], available, dependencies[name]["ttl"])
+                results[name] = available
+            if any(name in keys for name in stale):
+                self._save_cache()
         
         missing_required = []
         missing_optional = []
         
         for name, config in dependencies.items():
-            try:
-                result = subprocess.run(
-                    config["cmd"], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    self.logger.info(f"✅ {name}: Available")
+            available = results[name]
+            if available:
+                self.logger.info(f"✅ {name}: Available")
+            elif available is False:
+                if config["required"]:
+                    missing_required.append(name)
                 else:
-                    if config["required"]:
-                        missing_required.append(name)
-                    else:
-                        missing_optional.append(name)
-                        self.logger.warning(f"⚠️  {name}: Not available (optional)")
-            except (subprocess.TimeoutExpired, FileNotFoundError):
+                    missing_optional.append(name)
+                    self.logger.warning(f"⚠️  {name}: Not available (optional)")
+            else:
                 if config["required"]:
                     missing_required.append(name)
                     self.logger.error(f"❌ {name}: Not found (required)")
@@ -81,7 +130,32 @@ class LocalRunner:
         
         return True
     
-    def setup_environment(self):
+    async def _probe_dependency(self, config: Dict[str, Any]) -> Optional[bool]:
+        """Probe one dependency: True if available, False if not, None if not found"""
+        try:
+            if "address" in config:
+                host, port = config["address"]
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=2)
+                writer.close()
+                return True
+            
+            process = await asyncio.create_subprocess_exec(
+                *config["cmd"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            try:
+                return await asyncio.wait_for(process.wait(), timeout=5) == 0
+            except asyncio.TimeoutError:
+                process.kill()
+                return None
+        except FileNotFoundError:
+            return None
+        except (OSError, asyncio.TimeoutError):
+            # Nothing listening on the service port
+            return False
+    
+    def setup_environment(self, force_reinstall: bool = False):
         """Setup local environment"""
         self.logger.info("Setting up local environment...")
         
@@ -95,19 +169,37 @@ class LocalRunner:
         
         for dir_name in dirs_to_create:
             Path(dir_name).mkdir(exist_ok=True)
-            self.logger.info(f"Created directory: {dir_name}")
+        self.logger.info(f"Created directories: {', '.join(dirs_to_create)}")
+        
+        # Skip pip entirely when requirements.txt and the interpreter are unchanged
+        requirements_hash = hashlib.sha256(
+            Path("requirements.txt").read_bytes() + f"{sys.prefix}\0{sys.version}".encode()
+        ).hexdigest()
+        if not force_reinstall:
+            try:
+                if self.PIP_STAMP_PATH.read_text().strip() == requirements_hash:
+                    self.logger.info("✅ Python dependencies already satisfied (cached)")
+                    return True
+            except OSError:
+                pass
         
         # Install Python dependencies
         self.logger.info("Installing Python dependencies...")
+        cmd = [
+            sys.executable, "-m", "pip", "install",
+            "--quiet", "--disable-pip-version-check",
+            "-r", "requirements.txt"
+        ]
+        if force_reinstall:
+            cmd.append("--force-reinstall")
         try:
-            subprocess.run([
-                sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-            ], check=True)
+            subprocess.run(cmd, check=True)
             self.logger.info("✅ Python dependencies installed")
         except subprocess.CalledProcessError as e:
             self.logger.error(f"❌ Failed to install dependencies: {e}")
             return False
         
+        self.PIP_STAMP_PATH.write_text(requirements_hash)
         return True
     
     def start_mock_services(self):
@@ -125,83 +217,146 @@ class LocalRunner:
     
     def _is_service_available(self, service_name: str, host: str, port: int) -> bool:
         """Check if a service is available on given host:port"""
-        import socket
+        # Only successes are cached, so readiness waits keep re-probing. The memo is
+        # in-process: a port that was up during the last launch says nothing about this one
+        expires = self._service_cache.get((host, port))
+        if expires is not None and expires > time.monotonic():
+            return True
+        
         try:
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
                 sock.settimeout(2)
                 result = sock.connect_ex((host, port))
-                return result == 0
         except:
             return False
+        
+        if result == 0:
+            self._service_cache[(host, port)] = time.monotonic() + 2
+        return result == 0
+    
+    def _wait_ready(self, service_name: str, host: str, port: int, timeout: float = 15,
+                    process: Optional[subprocess.Popen] = None) -> bool:
+        """Poll host:port every 50 ms until it accepts connections or timeout expires"""
+        deadline = time.monotonic() + timeout
+        while not self._is_service_available(service_name, host, port):
+            if process is not None and process.poll() is not None:
+                self.logger.warning(f"{service_name} exited before becoming ready")
+                return False
+            if time.monotonic() >= deadline:
+                self.logger.warning(f"{service_name} not ready on {host}:{port} after {timeout}s")
+                return False
+            
+            # Keep forwarding child output while we wait so its pipe can't fill up
+            if self._selector is not None and self._selector.get_map():
+                for key, _ in self._selector.select(timeout=0.05):
+                    self._drain_output(key.fd, key.data[1])
+            else:
+                time.sleep(0.05)
+        return True
+    
+    def _load_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached probe results from disk"""
+        try:
+            return json.loads(self.CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self) -> None:
+        """Persist cached probe results"""
+        try:
+            self.CACHE_PATH.parent.mkdir(exist_ok=True)
+            self.CACHE_PATH.write_text(json.dumps(self._cache))
+        except OSError as e:
+            self.logger.debug(f"Could not write runner cache: {e}")
+    
+    def _cache_get(self, key: str) -> tuple:
+        """Return (hit, value) for an unexpired cache entry"""
+        entry = self._cache.get(key)
+        if entry and entry["expires"] > time.time():
+            return True, entry["value"]
+        return False, None
+    
+    def _cache_set(self, key: str, value: Any, ttl: int) -> None:
+        """Cache a probe result for ttl seconds"""
+        self._cache[key] = {"value": value, "expires": time.time() + ttl}
     
     def _start_docker_postgres(self):
         """Start PostgreSQL with Docker"""
-        try:
-            cmd = [
-                "docker", "run", "-d",
-                "--name", "callcenter_postgres_dev",
+        started = self._ensure_docker_service(
+            "PostgreSQL", "callcenter_postgres_dev",
+            [
                 "-e", "POSTGRES_DB=call_center_db",
-                "-e", "POSTGRES_USER=callcenter", 
+                "-e", "POSTGRES_USER=callcenter",
                 "-e", "POSTGRES_PASSWORD=callcenter_pass",
                 "-p", "5432:5432",
                 "postgres:15-alpine"
-            ]
-            
-            # Check if container already exists
-            check_cmd = ["docker", "ps", "-a", "--filter", "name=callcenter_postgres_dev", "--format", "{{.Names}}"]
-            result = subprocess.run(check_cmd, capture_output=True, text=True)
-            
-            if "callcenter_postgres_dev" in result.stdout:
-                # Container exists, start it
-                subprocess.run(["docker", "start", "callcenter_postgres_dev"], check=True)
-                self.logger.info("✅ Started existing PostgreSQL container")
-            else:
-                # Create new container
-                subprocess.run(cmd, check=True)
-                self.logger.info("✅ Created and started PostgreSQL container")
-            
-            # Wait for PostgreSQL to be ready
-            for i in range(30):
-                if self._is_service_available("postgresql", "localhost", 5432):
-                    break
-                time.sleep(1)
-            
-        except subprocess.CalledProcessError:
+            ],
+            port=5432, timeout=30
+        )
+        if not started:
             self.logger.warning("⚠️  Could not start PostgreSQL with Docker. Using SQLite fallback.")
             # Update settings to use SQLite
             os.environ["DATABASE_URL"] = "sqlite:///./call_center.db"
     
     def _start_docker_redis(self):
         """Start Redis with Docker"""
-        try:
-            cmd = [
-                "docker", "run", "-d",
-                "--name", "callcenter_redis_dev",
-                "-p", "6379:6379",
-                "redis:7-alpine"
-            ]
-            
-            # Check if container already exists
-            check_cmd = ["docker", "ps", "-a", "--filter", "name=callcenter_redis_dev", "--format", "{{.Names}}"]
-            result = subprocess.run(check_cmd, capture_output=True, text=True)
-            
-            if "callcenter_redis_dev" in result.stdout:
-                subprocess.run(["docker", "start", "callcenter_redis_dev"], check=True)
-                self.logger.info("✅ Started existing Redis container")
-            else:
-                subprocess.run(cmd, check=True)
-                self.logger.info("✅ Created and started Redis container")
-            
-            # Wait for Redis to be ready
-            for i in range(10):
-                if self._is_service_available("redis", "localhost", 6379):
-                    break
-                time.sleep(1)
-                
-        except subprocess.CalledProcessError:
+        started = self._ensure_docker_service(
+            "Redis", "callcenter_redis_dev",
+            ["-p", "6379:6379", "redis:7-alpine"],
+            port=6379, timeout=10
+        )
+        if not started:
             self.logger.warning("⚠️  Could not start Redis with Docker. Disabling Redis features.")
             os.environ["REDIS_URL"] = ""
     
+    def _ensure_docker_service(self, service_name: str, container: str, run_args: List[str],
+                               port: int, timeout: float) -> bool:
+        """Start a dev container, creating it if needed, and wait for its port"""
+        commands = {
+            "start": ["docker", "start", container],
+            "run": ["docker", "run", "-d", "--name", container, *run_args]
+        }
+        messages = {
+            "start": f"✅ Started existing {service_name} container",
+            "run": f"✅ Created and started {service_name} container"
+        }
+        
+        try:
+            # Pick start vs run from the remembered container list: one docker call per service
+            names = self._docker_containers()
+            first = "start" if container in names else "run"
+            for action in (first, "run" if first == "start" else "start"):
+                result = subprocess.run(commands[action], capture_output=True, text=True)
+                if result.returncode == 0:
+                    self.logger.info(messages[action])
+                    break
+                # The list was stale (container removed or created elsewhere); relist next time
+                self._cache.pop("docker:containers", None)
+            else:
+                raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return False
+        
+        if container not in names:
+            self._cache_set("docker:containers", sorted(names | {container}), 3600)
+        self._save_cache()
+        
+        # Wait for the service to be ready
+        self._wait_ready(service_name, "localhost", port, timeout=timeout)
+        return True
+    
+    def _docker_containers(self) -> set:
+        """Names of all Docker containers, listed once and cached across launches"""
+        hit, names = self._cache_get("docker:containers")
+        if not hit:
+            result = subprocess.run(
+                ["docker", "ps", "-a", "--format", "{{.Names}}"],
+                capture_output=True, text=True, check=True
+            )
+            names = result.stdout.split()
+            self._cache_set("docker:containers", names, 3600)
+        return set(names)
+    
     def start_application(self, component: str = "all"):
         """Start application components"""
         self.logger.info(f"Starting application component: {component}")
@@ -210,6 +365,8 @@ class LocalRunner:
         try:
             if component == "all":
                 self._start_all_components()
+            elif component == "combined":
+                self._start_all_components(combined=True)
             elif component == "api":
                 self._start_api_server()
             elif component == "dashboard":
@@ -232,37 +389,40 @@ class LocalRunner:
         finally:
             self.stop_application()
     
-    def _start_all_components(self):
+    def _start_all_components(self, combined: bool = False):
         """Start all application components"""
-        components = [
-            ("agents", [sys.executable, "main.py", "system"]),
-            ("api", [sys.executable, "main.py", "api", "--reload"]),
-            ("dashboard", [sys.executable, "main.py", "dashboard"])
-        ]
+        # (name, command, port to wait on; None for components that don't listen)
+        if combined:
+            # Agents and API share one interpreter; Streamlit runs its own server and stays separate
+            components = [
+                ("system", [sys.executable, "main.py", "combined"], 8000),
+                ("dashboard", [sys.executable, "main.py", "dashboard"], 8501)
+            ]
+        else:
+            components = [
+                ("agents", [sys.executable, "main.py", "system"], None),
+                ("api", [sys.executable, "main.py", "api", "--reload"], 8000),
+                ("dashboard", [sys.executable, "main.py", "dashboard"], 8501)
+            ]
         
-        for name, cmd in components:
+        for name, cmd, port in components:
             try:
                 self.logger.info(f"Starting {name}...")
+                # Binary pipe: output is decoded in bulk by the reader, not per line by io
                 process = subprocess.Popen(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
+                    bufsize=65536
                 )
                 self.processes[name] = process
+                self._watch_output(name, process)
                 
-                # Start log monitoring thread
-                thread = threading.Thread(
-                    target=self._monitor_process_output,
-                    args=(name, process),
-                    daemon=True
-                )
-                thread.start()
-                
-                # Give each component time to start
-                time.sleep(2)
+                # Move on as soon as the component is listening
+                if port is None:
+                    time.sleep(0.2)
+                else:
+                    self._wait_ready(name, "localhost", port, process=process)
                 
             except Exception as e:
                 self.logger.error(f"Failed to start {name}: {e}")
@@ -289,62 +449,192 @@ class LocalRunner:
         self.logger.info("Agent system started")
     
     def _monitor_process_output(self, name: str, process: subprocess.Popen):
-        """Monitor process output and log it"""
+        """Monitor process output and log it (reader thread, used without a selector)"""
         try:
-            for line in iter(process.stdout.readline, ''):
-                if line:
-                    self.logger.info(f"[{name}] {line.strip()}")
+            for line in iter(process.stdout.readline, b''):
+                if line.strip():
+                    self.logger.info(f"[{name}] {line.decode(errors='replace').strip()}")
         except Exception as e:
             self.logger.error(f"Error monitoring {name}: {e}")
     
+    def _watch_output(self, name: str, process: subprocess.Popen):
+        """Forward a child's output to the log from the monitor loop"""
+        if self._selector is None:
+            # Windows can't select() on pipes; keep a reader thread there
+            thread = threading.Thread(
+                target=self._monitor_process_output,
+                args=(name, process),
+                daemon=True
+            )
+            thread.start()
+            return
+        
+        # Only our read end goes non-blocking. Creating the pipe with pipe2(O_NONBLOCK) would
+        # also hand the child a non-blocking stdout, and its writes would fail with EAGAIN
+        # whenever the pipe fills. Output isn't spliced straight to a file either: each line
+        # is tagged with the component name and goes to the console as well as the log file.
+        os.set_blocking(process.stdout.fileno(), False)
+        self._selector.register(process.stdout.fileno(), selectors.EVENT_READ, ("output", name))
+    
+    def _drain_output(self, fd: int, name: str):
+        """Read whatever a child has written and log complete lines"""
+        try:
+            data = os.read(fd, 65536)
+        except BlockingIOError:
+            return
+        
+        buffered = self._output_buffers.pop(name, b"") + data
+        if not data:
+            # EOF: the child closed its output
+            self._selector.unregister(fd)
+            complete, rest = buffered, b""
+        else:
+            complete, _, rest = buffered.rpartition(b"\n")
+        
+        # One decode per read for every complete line; the partial tail waits for more
+        for line in complete.decode(errors="replace").splitlines():
+            if line.strip():
+                self.logger.info("[%s] %s", name, line.strip())
+        if rest:
+            self._output_buffers[name] = rest
+    
+    def _open_pidfds(self) -> Optional[Dict[int, str]]:
+        """Open a pidfd per child, or return None where pidfds are unsupported"""
+        if self._selector is None or self._wake_fd is None or not hasattr(os, "pidfd_open"):
+            return None
+        
+        pidfds = {}
+        try:
+            for name, process in self.processes.items():
+                pidfds[os.pidfd_open(process.pid)] = name
+        except OSError:
+            # Kernel older than 5.3
+            for fd in pidfds:
+                os.close(fd)
+            return None
+        return pidfds
+    
     def _monitor_processes(self):
-        """Monitor running processes"""
-        while self.running:
-            try:
-                # Check if processes are still running
-                dead_processes = []
-                for name, process in self.processes.items():
-                    if process.poll() is not None:
-                        dead_processes.append(name)
+        """Monitor running processes and their output from a single selector (epoll on Linux)"""
+        pidfds = self._open_pidfds()
+        if pidfds is None:
+            self._poll_processes()
+            return
+        
+        selector = self._selector
+        try:
+            selector.register(self._wake_fd, selectors.EVENT_READ, ("wake", None))
+            for fd, name in pidfds.items():
+                selector.register(fd, selectors.EVENT_READ, ("exit", name))
+            
+            # Blocks until a child writes output, exits, or a signal arrives
+            while self.running and pidfds:
+                for key, _ in selector.select():
+                    kind, name = key.data
+                    if kind == "output":
+                        self._drain_output(key.fd, name)
+                    elif kind == "exit":
+                        del pidfds[key.fd]
+                        selector.unregister(key.fd)
+                        os.close(key.fd)
+                        
+                        # Reap the child and drop it
+                        self.processes.pop(name).poll()
                         self.logger.warning(f"Process {name} has stopped")
+                    # "wake": the signal handler cleared self.running
+            
+            if not pidfds and self.running:
+                self.logger.info("All processes have stopped")
                 
+        except Exception as e:
+            self.logger.error(f"Error monitoring processes: {e}")
+        finally:
+            selector.unregister(self._wake_fd)
+            for fd in pidfds:
+                selector.unregister(fd)
+                os.close(fd)
+    
+    def _poll_processes(self):
+        """Monitor running processes by polling (fallback without pidfd support)"""
+        while self.running:
+            try:
                 # Remove dead processes
-                for name in dead_processes:
+                for name in self._exited_processes():
                     del self.processes[name]
+                    self.logger.warning(f"Process {name} has stopped")
                 
                 # If all processes are dead, stop
                 if not self.processes and self.running:
                     self.logger.info("All processes have stopped")
                     break
                 
-                time.sleep(5)
+                # Forward child output while waiting for the next check
+                if self._selector is not None and self._selector.get_map():
+                    for key, _ in self._selector.select(timeout=5):
+                        self._drain_output(key.fd, key.data[1])
+                else:
+                    time.sleep(5)
                 
             except Exception as e:
                 self.logger.error(f"Error monitoring processes: {e}")
                 break
     
+    def _exited_processes(self) -> List[str]:
+        """Return the names of children that have exited, reaping them"""
+        if not hasattr(os, "waitid"):
+            return [name for name, process in self.processes.items() if process.poll() is not None]
+        
+        # One waitid() per tick finds any exited child, instead of one waitpid() per child
+        names = {process.pid: name for name, process in self.processes.items()}
+        exited = []
+        while names:
+            try:
+                # WNOWAIT leaves the zombie for Popen.poll() to reap, so returncode stays set
+                info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+            except ChildProcessError:
+                break
+            if info is None:
+                break
+            
+            name = names.pop(info.si_pid, None)
+            if name is None:
+                # Not one of ours (it would be reported again forever); check ours directly
+                exited += [name for pid, name in names.items() if self.processes[name].poll() is not None]
+                break
+            self.processes[name].poll()
+            exited.append(name)
+        return exited
+    
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals"""
         self.logger.info(f"Received signal {signum}, shutting down...")
         self.running = False
+        if self._wake_fd is not None:
+            os.eventfd_write(self._wake_fd, 1)
     
     def stop_application(self):
         """Stop all application components"""
         self.logger.info("Stopping application...")
         self.running = False
         
-        # Stop all processes
+        # Signal every process first so a slow child doesn't delay the others' SIGTERM
         for name, process in self.processes.items():
             try:
                 self.logger.info(f"Stopping {name}...")
                 process.terminate()
-                
-                # Wait for process to stop
+            except Exception as e:
+                self.logger.error(f"Error stopping {name}: {e}")
+        
+        # Then wait against one shared deadline: total time is the slowest child, not the sum
+        deadline = time.monotonic() + 10
+        for name, process in self.processes.items():
+            try:
                 try:
-                    process.wait(timeout=10)
+                    process.wait(timeout=max(0, deadline - time.monotonic()))
                 except subprocess.TimeoutExpired:
                     self.logger.warning(f"Force killing {name}...")
                     process.kill()
+                    process.wait()
                     
             except Exception as e:
                 self.logger.error(f"Error stopping {name}: {e}")
@@ -354,24 +644,34 @@ class LocalRunner:
     
     def print_startup_info(self):
         """Print startup information"""
-        print("\n" + "="*60)
-        print("🚀 AI Call Center System - Local Development")
-        print("="*60)
-        print(f"📂 Project Directory: {Path.cwd()}")
-        print(f"🐍 Python Version: {sys.version}")
-        print(f"🔧 Environment: {os.getenv('ENVIRONMENT', 'development')}")
-        print("\n📋 Available Services:")
-        print("   • API Server:     http://localhost:8000")
-        print("   • Dashboard:      http://localhost:8501") 
-        print("   • API Docs:       http://localhost:8000/docs")
-        print("   • Health Check:   http://localhost:8000/health")
-        print("\n📊 Monitoring:")
-        print("   • Logs:           tail -f logs/call_center.log")
-        print("   • System Status:  python main.py status")
-        print("\n⌨️  Commands:")
-        print("   • Stop:           Ctrl+C")
-        print("   • Restart:        python run_local.py")
-        print("="*60 + "\n")
+        rule = "=" * 60
+        banner = f"""
+{rule}
+🚀 AI Call Center System - Local Development
+{rule}
+📂 Project Directory: {Path.cwd()}
+🐍 Python Version: {sys.version}
+🔧 Environment: {os.getenv('ENVIRONMENT', 'development')}
+
+📋 Available Services:
+   • API Server:     http://localhost:8000
+   • Dashboard:      http://localhost:8501
+   • API Docs:       http://localhost:8000/docs
+   • Health Check:   http://localhost:8000/health
+
+📊 Monitoring:
+   • Logs:           tail -f logs/call_center.log
+   • System Status:  python main.py status
+
+⌨️  Commands:
+   • Stop:           Ctrl+C
+   • Restart:        python run_local.py
+{rule}
+
+"""
+        # One write for the whole banner instead of a print() per line
+        sys.stdout.write(banner)
+        sys.stdout.flush()
 
 
 def main():
@@ -381,19 +681,29 @@ def main():
     parser = argparse.ArgumentParser(description="Run AI Call Center System Locally")
     parser.add_argument(
         "--component", 
-        choices=["all", "api", "dashboard", "agents"],
+        choices=["all", "combined", "api", "dashboard", "agents"],
         default="all",
-        help="Component to run (default: all)"
+        help="Component to run (default: all; combined runs agents and API in one process)"
     )
     parser.add_argument(
         "--setup", 
         action="store_true",
         help="Setup environment and install dependencies"
     )
+    parser.add_argument(
+        "--force-reinstall",
+        action="store_true",
+        help="With --setup, reinstall dependencies even if requirements.txt is unchanged"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached dependency checks and probe again"
+    )
     
     args = parser.parse_args()
     
-    runner = LocalRunner()
+    runner = LocalRunner(use_cache=not args.no_cache)
     
     try:
         # Print startup info
@@ -406,7 +716,7 @@ def main():
         
         # Setup environment if requested
         if args.setup:
-            if not runner.setup_environment():
+            if not runner.setup_environment(force_reinstall=args.force_reinstall):
                 print("❌ Environment setup failed.")
                 return 1
         
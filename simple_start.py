@@ -6,6 +6,18 @@ import os
 import uvicorn
 from pathlib import Path
 
+# uvloop and httptools are optional C speedups; uvicorn falls back to asyncio/h11
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import httptools  # noqa: F401
+    _HTTP_PARSER = "httptools"
+except ImportError:
+    _HTTP_PARSER = "h11"
+
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
@@ -19,15 +31,26 @@ def main():
     os.environ.setdefault("DEBUG", "true")
     os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./call_center.db")
     
+    # The reload watcher imports the app twice and costs throughput, so it is opt-in
+    reload = "--reload" in sys.argv[1:]
+    workers = 1 if reload else int(os.getenv("API_WORKERS", "1"))
+    server_options = dict(
+        host="0.0.0.0",
+        port=8000,
+        log_level="info",
+        loop="uvloop" if uvloop is not None else "asyncio",
+        http=_HTTP_PARSER
+    )
+    
     try:
-        # Run the API server directly
-        uvicorn.run(
-            "api.main:app",
-            host="0.0.0.0",
-            port=8000,
-            reload=True,
-            log_level="info"
-        )
+        if reload or workers > 1:
+            # Reload and multi-process modes need an import string so children can load the app
+            uvicorn.run("api.main:app", reload=reload, workers=workers, **server_options)
+        else:
+            # Run the API server directly
+            from api.main import app
+            
+            uvicorn.Server(uvicorn.Config(app, **server_options)).run()
     except KeyboardInterrupt:
         print("\n👋 Server stopped")
     except Exception as e:
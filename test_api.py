@@ -1,31 +1,38 @@
 #!/usr/bin/env python3
 """Test script for the AI Call Center API"""
 
-import requests
+import argparse
+import asyncio
+import httpx
 import json
 import time
 
 BASE_URL = "http://localhost:8000"
 
-def test_health():
+def report(lines):
+    """Print a test's output as one block so concurrent tests don't interleave"""
+    print("\n".join(lines) + "\n")
+
+async def check_health(client):
     """Test health endpoint"""
-    print("🔍 Testing health endpoint...")
-    response = requests.get(f"{BASE_URL}/health")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.json()}")
-    print()
+    response = await client.get("/health")
+    report([
+        "🔍 Testing health endpoint...",
+        f"Status: {response.status_code}",
+        f"Response: {response.json()}"
+    ])
 
-def test_system_status():
+async def check_system_status(client):
     """Test system status"""
-    print("🔍 Testing system status...")
-    response = requests.get(f"{BASE_URL}/api/v1/status")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    print()
+    response = await client.get("/api/v1/status")
+    report([
+        "🔍 Testing system status...",
+        f"Status: {response.status_code}",
+        f"Response: {json.dumps(response.json(), indent=2)}"
+    ])
 
-def test_create_call():
+async def check_create_call(client):
     """Test creating a new call"""
-    print("🔍 Testing call creation...")
     call_data = {
         "customer_phone": "+1-555-0123",
         "priority": "high",
@@ -35,87 +42,115 @@ def test_create_call():
         }
     }
     
-    response = requests.post(f"{BASE_URL}/api/v1/calls", json=call_data)
-    print(f"Status: {response.status_code}")
+    response = await client.post("/api/v1/calls", json=call_data)
     result = response.json()
-    print(f"Response: {json.dumps(result, indent=2)}")
+    lines = [
+        "🔍 Testing call creation...",
+        f"Status: {response.status_code}",
+        f"Response: {json.dumps(result, indent=2)}"
+    ]
     
+    call_id = None
     if result.get("success"):
         call_id = result["call"]["call_id"]
-        print(f"✅ Created call with ID: {call_id}")
-        return call_id
-    print()
+        lines.append(f"✅ Created call with ID: {call_id}")
+    report(lines)
+    return call_id
 
-def test_get_call(call_id):
+async def check_get_call(client, call_id):
     """Test getting call details"""
-    print(f"🔍 Testing get call details for {call_id}...")
-    response = requests.get(f"{BASE_URL}/api/v1/calls/{call_id}")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    print()
+    response = await client.get(f"/api/v1/calls/{call_id}")
+    report([
+        f"🔍 Testing get call details for {call_id}...",
+        f"Status: {response.status_code}",
+        f"Response: {json.dumps(response.json(), indent=2)}"
+    ])
 
-def test_list_calls():
+async def check_list_calls(client):
     """Test listing calls"""
-    print("🔍 Testing list calls...")
-    response = requests.get(f"{BASE_URL}/api/v1/calls?limit=5")
-    print(f"Status: {response.status_code}")
+    response = await client.get("/api/v1/calls?limit=5")
     result = response.json()
-    print(f"Found {result.get('total', 0)} calls")
-    print(f"Response: {json.dumps(result, indent=2)}")
-    print()
+    report([
+        "🔍 Testing list calls...",
+        f"Status: {response.status_code}",
+        f"Found {result.get('total', 0)} calls",
+        f"Response: {json.dumps(result, indent=2)}"
+    ])
 
-def test_list_agents():
+async def check_list_agents(client):
     """Test listing agents"""
-    print("🔍 Testing list agents...")
-    response = requests.get(f"{BASE_URL}/api/v1/agents")
-    print(f"Status: {response.status_code}")
-    print(f"Response: {json.dumps(response.json(), indent=2)}")
-    print()
+    response = await client.get("/api/v1/agents")
+    report([
+        "🔍 Testing list agents...",
+        f"Status: {response.status_code}",
+        f"Response: {json.dumps(response.json(), indent=2)}"
+    ])
 
-def test_dashboard_analytics():
+async def check_dashboard_analytics(client):
     """Test dashboard analytics"""
-    print("🔍 Testing dashboard analytics...")
-    response = requests.get(f"{BASE_URL}/api/v1/analytics/dashboard")
-    print(f"Status: {response.status_code}")
+    response = await client.get("/api/v1/analytics/dashboard")
     result = response.json()
+    lines = [
+        "🔍 Testing dashboard analytics...",
+        f"Status: {response.status_code}"
+    ]
     if result.get("success"):
         data = result["data"]
-        print(f"Active calls: {data['metrics']['active_calls']}")
-        print(f"Available agents: {data['metrics']['available_agents']}")
-        print(f"Average quality score: {data['metrics']['average_quality_score']}")
-        print(f"Recent activity: {len(data['recent_activity'])} events")
-    print()
+        lines += [
+            f"Active calls: {data['metrics']['active_calls']}",
+            f"Available agents: {data['metrics']['available_agents']}",
+            f"Average quality score: {data['metrics']['average_quality_score']}",
+            f"Recent activity: {len(data['recent_activity'])} events"
+        ]
+    report(lines)
+
+async def check_call_lifecycle(client):
+    """Create a call and read it back; these two must run in order"""
+    call_id = await check_create_call(client)
+    if call_id:
+        await check_get_call(client, call_id)
+
+async def run_tests(concurrency=1):
+    """Run every test, concurrency copies at once, over one pooled client"""
+    checks = [
+        check_health,
+        check_system_status,
+        check_call_lifecycle,
+        check_list_calls,
+        check_list_agents,
+        check_dashboard_analytics
+    ]
+    limits = httpx.Limits(max_connections=len(checks) * concurrency)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10.0, limits=limits) as client:
+        # The checks are independent (create/get stays ordered inside its own coroutine)
+        await asyncio.gather(*(check(client) for _ in range(concurrency) for check in checks))
 
 def main():
     """Run all tests"""
+    parser = argparse.ArgumentParser(description="Test the AI Call Center API")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Copies of the test mix to run at once (default: 1)"
+    )
+    args = parser.parse_args()
+    
     print("🚀 Testing AI Call Center System API")
     print("=" * 50)
     
+    start_time = time.time()
+    
     try:
-        # Basic health checks
-        test_health()
-        test_system_status()
-        
-        # Call management
-        call_id = test_create_call()
-        if call_id:
-            test_get_call(call_id)
-        
-        test_list_calls()
-        
-        # Agent management
-        test_list_agents()
-        
-        # Analytics
-        test_dashboard_analytics()
+        asyncio.run(run_tests(args.concurrency))
         
-        print("✅ All tests completed!")
+        print(f"✅ All tests completed in {time.time() - start_time:.2f} seconds!")
         
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ Error: Could not connect to the API server.")
         print("Make sure the server is running at http://localhost:8000")
     except Exception as e:
         print(f"❌ Error during testing: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()